@@ -0,0 +1,157 @@
+"""
+Load test for the API server under mixed read/write concurrency.
+
+Starts the FastAPI app on uvicorn in-process against a fresh SQLite database
+in a temp directory, seeds it, then runs concurrent clients issuing a mix of
+listing reads, request creation, lease + complete, and /api/feed polls.
+Reports throughput and p50/p99 latency per route. /api/feed never touches the
+database, so its tail latency shows how much DB work stalls the event loop.
+
+With --legacy it serves the same routes the way the API did before the thread
+pool and WAL setup: database routes as async def on the event loop, the default
+thread limiter, SQLAlchemy's default 5+10 connection pool and no SQLite pragmas
+(rollback journal). Run both modes to compare p50/p99 before and after.
+
+Run from the repository root:
+    python -m benchmarks.bench_api_load [clients] [requests_per_client] [seed_rows] [--legacy]
+"""
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import wraps
+
+import requests
+
+LEGACY = "--legacy" in sys.argv
+args = [a for a in sys.argv[1:] if a != "--legacy"]
+CLIENTS = int(args[0]) if len(args) > 0 else 32
+PER_CLIENT = int(args[1]) if len(args) > 1 else 100
+SEED_ROWS = int(args[2]) if len(args) > 2 else 50000
+PORT = 8765
+
+tmp = tempfile.TemporaryDirectory()
+os.chdir(tmp.name)  # The API's SQLite database is created relative to the working directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from sqlalchemy import create_engine
+from sentinel import models
+from sentinel.api import server
+from sentinel.models import SessionLocal, VerificationRequest, init_db
+
+def on_event_loop(endpoint):
+    # An async wrapper makes FastAPI call the sync route directly on the event loop
+    @wraps(endpoint)
+    async def run(*args, **kwargs):
+        return endpoint(*args, **kwargs)
+    return run
+
+def legacy_app() -> FastAPI:
+    """
+    The same routes, served the way they were before the thread pool and WAL setup.
+    """
+    engine = create_engine("sqlite:///silverlock.db", connect_args={"check_same_thread": False})
+    models.engine = engine  # init_db() looks the engine up on the module
+    SessionLocal.configure(bind=engine)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        init_db()  # Default thread limiter: not resized to the connection pool
+        yield
+
+    app = FastAPI(lifespan=lifespan)
+    for route in server.app.routes:
+        if isinstance(route, APIRoute):
+            endpoint = route.endpoint if asyncio.iscoroutinefunction(route.endpoint) else on_event_loop(route.endpoint)
+            app.add_api_route(route.path, endpoint, methods=list(route.methods), response_class=route.response_class)
+    return app
+
+app = legacy_app() if LEGACY else server.app
+
+def seed():
+    init_db()  # The server lifespan would too, but seeding happens before it starts
+    db = SessionLocal()
+    db.bulk_insert_mappings(VerificationRequest, [
+        {"req_uuid": f"seed-{i}", "requester_id": 1 + i % 3, "model_name": "loan_approval_v1",
+         "input_context": f"Loan Application #{i}", "status": "PENDING" if i % 10 == 0 else "VERIFIED"}
+        for i in range(SEED_ROWS)
+    ])
+    db.commit()
+    db.close()
+
+def start_server():
+    # Failures are counted per route below rather than logged with tracebacks
+    config = uvicorn.Config(app, host="127.0.0.1", port=PORT, log_level="critical")
+    uv = uvicorn.Server(config)
+    thread = threading.Thread(target=uv.run, daemon=True)
+    thread.start()
+    while not uv.started:
+        time.sleep(0.05)
+    return uv, thread
+
+base = f"http://127.0.0.1:{PORT}"
+latencies = defaultdict(list)
+errors = defaultdict(int)
+lock = threading.Lock()
+
+def client(worker: int):
+    rng = random.Random(worker)
+    session = requests.Session()
+    for _ in range(PER_CLIENT):
+        roll = rng.random()
+        start = time.perf_counter()
+        try:
+            if roll < 0.35:
+                route = "GET /api/requests"
+                res = session.get(f"{base}/api/requests", params={"username": rng.choice(["alice_risk", "bob_trader"]), "limit": 100}, timeout=60)
+            elif roll < 0.55:
+                route = "POST /api/request"
+                res = session.post(f"{base}/api/request", json={"username": "bob_trader", "model_name": "loan_approval_v1", "input_context": "bench"}, timeout=60)
+            elif roll < 0.75:
+                route = "lease + complete"
+                res = session.post(f"{base}/api/lease", json={"node_id": f"bench-{worker}", "limit": 1}, timeout=60)
+                lease = res.json()
+                for job in lease["requests"]:
+                    res = session.post(f"{base}/api/complete", json={"req_uuid": job["req_uuid"], "proof_cid": "QmBench", "lease_id": lease["lease_id"]}, timeout=60)
+            else:
+                route = "GET /api/feed"
+                res = session.get(f"{base}/api/feed", timeout=60)
+            ok = res.status_code < 400
+        except (requests.RequestException, ValueError):
+            ok = False
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies[route].append(elapsed)
+            if not ok:
+                errors[route] += 1
+
+seed()
+uv, thread = start_server()
+print(f"--- API LOAD TEST ({'legacy: async routes, default pool, no pragmas' if LEGACY else 'thread pool + WAL'}; "
+      f"{CLIENTS} clients x {PER_CLIENT} requests, {SEED_ROWS} seeded rows) ---")
+start = time.perf_counter()
+workers = [threading.Thread(target=client, args=(i,)) for i in range(CLIENTS)]
+for w in workers:
+    w.start()
+for w in workers:
+    w.join()
+elapsed = time.perf_counter() - start
+
+total = sum(len(v) for v in latencies.values())
+print(f"{total} requests in {elapsed:.2f}s ({total / elapsed:.1f} req/s)")
+print(f"{'route':<20} {'count':>6} {'errors':>6} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+for route, values in sorted(latencies.items()):
+    p99 = statistics.quantiles(values, n=100)[98] if len(values) > 1 else values[0]
+    print(f"{route:<20} {len(values):>6} {errors[route]:>6} {statistics.median(values):>9.1f} {p99:>9.1f} {max(values):>9.1f}")
+
+uv.should_exit = True
+thread.join()
@@ -0,0 +1,51 @@
+"""
+Runs hundreds of concurrent SecureRuntime.execute_async calls on one event loop
+and reports throughput plus the worst event-loop stall observed meanwhile.
+
+Run from the repository root:
+    python -m benchmarks.bench_async_execute [n_executions] [max_concurrency ...]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from sentinel.core.runtime import SecureRuntime
+
+N_EXECUTIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+CONCURRENCY_LEVELS = [int(a) for a in sys.argv[2:]] or [16, 64, 256]
+
+constraints = {"max_input_length": 2048, "privacy": {"min_score": 700, "min_income": 40000}}
+
+async def watch_loop(stop: asyncio.Event, interval: float = 0.005) -> float:
+    # A ticker that should wake every `interval`; anything later means the loop was blocked
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+async def run(runtime: SecureRuntime):
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(watch_loop(stop))
+    start = time.perf_counter()
+    proofs = await asyncio.gather(*[
+        runtime.execute_async(f'{{"applicant_id": {i}, "score": 720, "income": 50000}}', constraints)
+        for i in range(N_EXECUTIONS)
+    ])
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return elapsed, await watcher, len(proofs)
+
+with tempfile.TemporaryDirectory() as tmp:
+    model_path = os.path.join(tmp, "bench_model.bin")
+    with open(model_path, "wb") as f:
+        f.write(os.urandom(1024))
+
+    print(f"--- ASYNC EXECUTION BENCHMARK ({N_EXECUTIONS} concurrent executions, 100 ms simulated model) ---")
+    for limit in CONCURRENCY_LEVELS:
+        runtime = SecureRuntime(model_path, use_hash_cache=False, max_concurrency=limit)
+        elapsed, worst_stall, count = asyncio.run(run(runtime))
+        print(f"max_concurrency={limit:<4} {elapsed:7.2f}s  {count / elapsed:8.1f} exec/s  worst loop stall {worst_stall * 1000:6.1f} ms")
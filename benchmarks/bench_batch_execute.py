@@ -0,0 +1,44 @@
+"""
+Compares SecureRuntime.execute_batch against a plain loop over execute.
+
+Run from the repository root:
+    python -m benchmarks.bench_batch_execute [n_inputs] [max_workers]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from sentinel.core.runtime import SecureRuntime
+
+N_INPUTS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+MAX_WORKERS = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+constraints = {
+    "max_input_length": 2048,
+    "privacy": {"min_score": 700, "min_income": 40000, "age_limit": 18}
+}
+inputs = [json.dumps({"applicant_id": i, "score": 650 + i % 200, "income": 30000 + i * 10, "age": 30}) for i in range(N_INPUTS)]
+
+with tempfile.TemporaryDirectory() as tmp:
+    model_path = os.path.join(tmp, "bench_model.bin")
+    with open(model_path, "wb") as f:
+        f.write(os.urandom(1024 * 1024))
+
+    runtime = SecureRuntime(model_path)
+
+    print(f"--- BATCH EXECUTION BENCHMARK ({N_INPUTS} inputs) ---")
+
+    start = time.perf_counter()
+    loop_proofs = [runtime.execute(data, constraints) for data in inputs]
+    loop_elapsed = time.perf_counter() - start
+    print(f"Loop over execute():        {loop_elapsed:8.2f}s  {N_INPUTS / loop_elapsed:9.1f} inputs/s")
+
+    start = time.perf_counter()
+    results = runtime.execute_batch(inputs, constraints, max_workers=MAX_WORKERS)
+    batch_elapsed = time.perf_counter() - start
+    errors = sum(1 for r in results if r["error"])
+    print(f"execute_batch(workers={MAX_WORKERS:<3}): {batch_elapsed:8.2f}s  {N_INPUTS / batch_elapsed:9.1f} inputs/s  ({errors} errors)")
+
+    print(f"Speedup: {loop_elapsed / batch_elapsed:.1f}x")
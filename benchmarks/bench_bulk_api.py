@@ -0,0 +1,61 @@
+"""
+Rows/s for bulk ingestion and bulk completion versus the single-item endpoints.
+
+Drives the API in-process (FastAPI TestClient) against a fresh SQLite database
+in a temp directory, so the numbers measure server-side cost per row, not the
+network.
+
+Run from the repository root:
+    python -m benchmarks.bench_bulk_api [n_rows] [batch_size]
+"""
+import os
+import sys
+import tempfile
+import time
+
+N_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+BATCH_SIZE = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+tmp = tempfile.TemporaryDirectory()
+os.chdir(tmp.name)  # The API's SQLite database is created relative to the working directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from sentinel.api import server
+from sentinel.models import init_db
+
+init_db()  # Normally run by the app lifespan, which TestClient only enters inside a with block
+client = TestClient(server.app)
+applications = [{"username": "bob_trader", "model_name": "loan_approval_v1", "input_context": f"Loan Application #{i}"} for i in range(N_ROWS)]
+
+def lease_all(node_id):
+    jobs = []
+    while True:
+        lease = client.post("/api/lease", json={"node_id": node_id, "limit": 1000, "lease_seconds": 600}).json()
+        if not lease["requests"]:
+            return jobs
+        jobs.extend({"req_uuid": job["req_uuid"], "proof_cid": "QmBench", "lease_id": lease["lease_id"]} for job in lease["requests"])
+
+def rate(label, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:7.2f}s  {N_ROWS / elapsed:9.1f} rows/s")
+    return elapsed
+
+print(f"--- BULK API BENCHMARK ({N_ROWS} rows, batches of {BATCH_SIZE}) ---")
+
+single_ingest = rate("POST /api/request (one per call)", lambda: [client.post("/api/request", json=app) for app in applications])
+batch_ingest = rate("POST /api/request/batch", lambda: [
+    client.post("/api/request/batch", json=applications[i:i + BATCH_SIZE]) for i in range(0, N_ROWS, BATCH_SIZE)
+])
+
+# Half the leased jobs are completed one at a time, the other half in batches
+jobs = lease_all("bench-node")
+single_jobs, batch_jobs = jobs[:N_ROWS], jobs[N_ROWS:2 * N_ROWS]
+single_complete = rate("POST /api/complete (one per call)", lambda: [client.post("/api/complete", json=job) for job in single_jobs])
+batch_complete = rate("POST /api/complete/batch", lambda: [
+    client.post("/api/complete/batch", json=batch_jobs[i:i + BATCH_SIZE]) for i in range(0, len(batch_jobs), BATCH_SIZE)
+])
+
+print(f"speedup: ingestion {single_ingest / batch_ingest:.1f}x, completion {single_complete / batch_complete:.1f}x")
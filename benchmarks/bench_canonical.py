@@ -0,0 +1,68 @@
+"""
+Microbenchmark: per-proof canonicalization cost before and after serialize-once credentials.
+
+"Repeated" reproduces the old path (trace hash, signature payload, IPFS upload
+body and mock CID each ran their own json.dumps). "Serialize-once" is the
+current Credential path, where the trace is serialized once and every later
+consumer reuses the cached canonical bytes.
+
+Run from the repository root:
+    python -m benchmarks.bench_canonical [n_proofs]
+"""
+import hashlib
+import json
+import sys
+import time
+import tracemalloc
+
+from sentinel.core.credential import canonical_bytes
+from sentinel.core.proof import ProofGenerator
+
+N_PROOFS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+trace = {
+    "model_hash": "99aef214ca9fb7a2c734f1c4d00821d1b839626d0f73668bd9aea005b6419783",
+    "input_hash": "b76cc242859c95c32b7c43af077905899100bf5b83bd6548c3ea4b457260f7e2",
+    "public_input": '{"income": "REDACTED_ZKP_VERIFIED", "name": "Jane Doe", "score": "REDACTED_ZKP_VERIFIED"}',
+    "zkp_proofs": ["ZKP: Score >= 700 Verified", "ZKP: Income >= 40000 Verified"],
+    "constraints": {"max_input_length": 2048, "privacy": {"min_score": 700, "min_income": 40000, "age_limit": 18}},
+    "output": "SYS: LOAN_APPROVED | SCORE: Verified > Threshold | REASON: Strong Credit History",
+    "execution_time_ms": 100,
+    "executed_at": 1768890263.2861743
+}
+proof_block = {"type": "Ed25519Signature2020", "created": "2026-01-20T06:24:23Z", "verificationMethod": "did:key:z00#keys-1", "proofPurpose": "assertionMethod", "jws": "00" * 64}
+
+def repeated():
+    trace_hash = hashlib.sha256(json.dumps(trace, sort_keys=True).encode('utf-8')).hexdigest()
+    credential = {"@context": ["https://www.w3.org/2018/credentials/v1"], "issuer": "did:key:z00", "issuanceDate": "2026-01-20T06:24:23Z",
+                  "credentialSubject": {"id": f"urn:uuid:{trace_hash}", "executionTrace": trace, "traceHash": trace_hash}}
+    json.dumps(credential, sort_keys=True).encode('utf-8')  # signature payload
+    credential["proof"] = proof_block
+    json.dumps(credential)  # IPFS upload body
+    hashlib.sha256(json.dumps(credential).encode('utf-8')).hexdigest()  # mock CID
+
+def serialize_once(generator):
+    credential = generator._build_credential(trace, "2026-01-20T06:24:23Z")
+    credential.unsigned_bytes()  # signature payload
+    credential["proof"] = proof_block
+    content = canonical_bytes(credential)  # IPFS upload body
+    hashlib.sha256(content).hexdigest()  # mock CID
+
+class _StubDID:
+    did = "did:key:z00"
+
+generator = ProofGenerator(_StubDID())
+
+print(f"--- CANONICALIZATION MICROBENCHMARK ({N_PROOFS} proofs) ---")
+for name, fn in [("Repeated json.dumps", repeated), ("Serialize-once", lambda: serialize_once(generator))]:
+    start = time.perf_counter()
+    for _ in range(N_PROOFS):
+        fn()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for _ in range(1000):
+        fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<20} {elapsed * 1e6 / N_PROOFS:8.1f} us/proof   peak alloc over 1000 proofs: {peak / 1024:7.1f} KiB")
@@ -0,0 +1,93 @@
+"""
+CPU per row and queries per request for the request listings and login,
+before and after projection-based serialization.
+
+"ORM + jsonable_encoder" reproduces the old path (full ORM entities returned
+from the route and encoded by FastAPI's generic encoder, department loaded
+lazily on login). "Projection + fast JSON" calls the current routes, which
+select only the listed columns and encode rows directly.
+
+Run from the repository root:
+    python -m benchmarks.bench_listings [seed_rows] [page_size]
+"""
+import os
+import sys
+import tempfile
+import time
+
+SEED_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+PAGE_SIZE = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+tmp = tempfile.TemporaryDirectory()
+os.chdir(tmp.name)  # The API's SQLite database is created relative to the working directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+
+from sentinel.api import server
+from sentinel.api.pagination import keyset_page
+from sentinel.models import SessionLocal, User, VerificationRequest, engine, init_db
+
+queries = 0
+
+@event.listens_for(engine, "before_cursor_execute")
+def count_query(*args):
+    global queries
+    queries += 1
+
+init_db()  # Normally run by the app lifespan; the routes are called directly here
+db = SessionLocal()
+db.bulk_insert_mappings(VerificationRequest, [
+    {"req_uuid": f"seed-{i}", "requester_id": 1 + i % 3, "model_name": "loan_approval_v1",
+     "input_context": f"Loan Application #{i}: applicant income 85000, score 742", "status": "PENDING" if i % 10 == 0 else "VERIFIED",
+     "proof_cid": f"QmMock{i:040d}"}
+    for i in range(SEED_ROWS)
+])
+db.commit()
+
+def legacy_page(cursor):
+    user = db.query(User).filter(User.username == "alice_risk").first()
+    rows, next_cursor = keyset_page(db.query(VerificationRequest), VerificationRequest, cursor, PAGE_SIZE, descending=True)
+    body = JSONResponse(jsonable_encoder(rows)).body
+    db.expunge_all()  # Don't let the identity map grow across pages
+    return body, next_cursor
+
+def projected_page(cursor):
+    response = server.get_my_requests(username="alice_risk", limit=PAGE_SIZE, cursor=cursor, db=db)
+    return response.body, response.headers.get("X-Next-Cursor")
+
+def walk(page):
+    global queries
+    queries = 0
+    cursor, pages, rows, size = None, 0, 0, 0
+    start = time.perf_counter()
+    while True:
+        body, cursor = page(cursor)
+        pages += 1
+        size += len(body)
+        rows += body.count(b'"req_uuid"')
+        if not cursor:
+            break
+    return time.perf_counter() - start, pages, rows, size, queries
+
+def legacy_login():
+    user = db.query(User).filter(User.username == "alice_risk").first()
+    result = {"id": user.id, "username": user.username, "role": user.role, "full_name": user.full_name, "department": user.department.name}
+    db.expunge_all()
+    return result
+
+def login_queries(fn):
+    global queries
+    queries = 0
+    fn()
+    return queries
+
+print(f"--- LISTING SERIALIZATION BENCHMARK ({SEED_ROWS} rows, pages of {PAGE_SIZE}, risk-officer view) ---")
+print(f"{'path':<28} {'total':>8} {'us/row':>8} {'pages':>6} {'queries/page':>13} {'KiB':>8}")
+for label, page in [("ORM + jsonable_encoder", legacy_page), ("projection + fast JSON", projected_page)]:
+    elapsed, pages, rows, size, n_queries = walk(page)
+    print(f"{label:<28} {elapsed:>7.2f}s {elapsed / rows * 1e6:>8.1f} {pages:>6} {n_queries / pages:>13.1f} {size / 1024:>8.0f}")
+
+print(f"login queries: lazy department {login_queries(legacy_login)}, joinedload {login_queries(lambda: server.login(server.LoginRequest(username='alice_risk', password='password123'), db=db))}")
@@ -0,0 +1,101 @@
+"""
+Jobs/s for one Sentinel node: the sequential one-job-per-lease loop versus the
+headless pipeline (`start_node --workers N`).
+
+Starts the API on uvicorn and the IPFS stand-in (with per-request latency, like
+a real node over the network) in-process against a fresh SQLite database in a
+temp directory. For each configuration it queues n_jobs requests and times the
+node until all of them are completed. The sequential loop is the demo loop
+minus its cinematic delays, so it is an upper bound for the demo node.
+
+Run from the repository root:
+    python -m benchmarks.bench_node_workers [n_jobs] [ipfs_latency_ms] [workers ...]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+N_JOBS = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+IPFS_LATENCY_MS = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+WORKER_COUNTS = [int(a) for a in sys.argv[3:]] or [1, 4, 8]
+PORT = 8766
+
+tmp = tempfile.TemporaryDirectory()
+os.chdir(tmp.name)  # The API's SQLite database and the proof store are created relative to the working directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+import uvicorn
+from sentinel.api import server
+from sentinel.cli import NODE_CONSTRAINTS
+from sentinel.core.pool import ModelPool
+from sentinel.node import HeadlessNode
+from sentinel.storage.ipfs import IPFSStorage
+from sentinel.storage.standin import LocalIPFSNode
+
+base = f"http://127.0.0.1:{PORT}"
+model_path = os.path.join(tmp.name, "bench_model.bin")
+with open(model_path, "wb") as f:
+    f.write(os.urandom(1024 * 1024))
+
+def start_api():
+    uv = uvicorn.Server(uvicorn.Config(server.app, host="127.0.0.1", port=PORT, log_level="critical"))
+    threading.Thread(target=uv.run, daemon=True).start()
+    while not uv.started:
+        time.sleep(0.05)
+    return uv
+
+def queue_jobs():
+    applications = [{"username": "bob_trader", "model_name": "loan_approval_v1",
+                     "input_context": f'{{"applicant_id": {i}, "score": {650 + i % 200}, "income": {30000 + i * 10}, "age": 30}}'}
+                    for i in range(N_JOBS)]
+    for i in range(0, N_JOBS, 1000):
+        requests.post(f"{base}/api/request/batch", json=applications[i:i + 1000]).raise_for_status()
+
+def sequential(model_pool, storage):
+    # The demo loop's network and compute steps, one job at a time, without the delays
+    session = requests.Session()
+    done = 0
+    while done < N_JOBS:
+        lease = session.post(f"{base}/api/lease", json={"node_id": "bench-seq", "limit": 1}).json()
+        for job in lease["requests"]:
+            with model_pool.acquire(model_path) as runtime:
+                proof = runtime.execute(job["input_context"], NODE_CONSTRAINTS, metadata={"model_name": job["model_name"]})
+            cid = storage.save_proof(proof)
+            session.post(f"{base}/api/complete", json={"req_uuid": job["req_uuid"], "proof_cid": cid, "lease_id": lease["lease_id"]}).raise_for_status()
+            session.post(f"{base}/api/broadcast", json={"cid": cid, "type": "execution_proof"})
+            done += 1
+
+def pipelined(model_pool, storage, workers):
+    node = HeadlessNode(base, f"bench-{workers}", model_pool, storage, resolve_model=lambda name: model_path,
+                        constraints=NODE_CONSTRAINTS, workers=workers, interval=0.1, report_interval=3600, log=lambda line: None)
+    runner = threading.Thread(target=node.run)
+    runner.start()
+    while node.stats()["completed"] + node.stats()["failed"] < N_JOBS:
+        time.sleep(0.01)
+    node.stop()
+    runner.join()
+    stats = node.stats()
+    if stats["failed"] or stats["lost"]:
+        print(f"  ({stats['failed']} failed, {stats['lost']} lost)")
+
+uv = start_api()
+ipfs = LocalIPFSNode(latency=IPFS_LATENCY_MS / 1000).start()
+storage = IPFSStorage(host=ipfs.url)
+model_pool = ModelPool()
+
+print(f"--- NODE WORKERS BENCHMARK ({N_JOBS} jobs, IPFS latency {IPFS_LATENCY_MS:.0f} ms) ---")
+baseline = None
+for label, run in [("sequential (1 job per lease)", lambda: sequential(model_pool, storage))] + [
+        (f"--workers {n}", lambda n=n: pipelined(model_pool, storage, n)) for n in WORKER_COUNTS]:
+    queue_jobs()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    baseline = baseline or elapsed
+    print(f"{label:<30} {elapsed:7.2f}s  {N_JOBS / elapsed:8.1f} jobs/s  {baseline / elapsed:5.1f}x")
+
+ipfs.stop()
+uv.should_exit = True
@@ -0,0 +1,86 @@
+"""
+Compares the one-file-per-proof layout (LocalProofStore) with compressed
+packfiles (PackfileProofStore), with and without a shared zlib dictionary:
+bytes actually allocated on disk, files created, write time and random-read
+latency.
+
+Run from the repository root:
+    python -m benchmarks.bench_packfile [n_proofs] [n_reads]
+"""
+import hashlib
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sentinel.core.credential import canonical_bytes
+from sentinel.core.proof import ProofGenerator
+from sentinel.storage.local import LocalProofStore
+from sentinel.storage.packfile import PackfileProofStore, build_dictionary
+
+N_PROOFS = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+N_READS = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+
+random.seed(11)
+generator = ProofGenerator()
+
+def make_proof(i):
+    score = random.randint(550, 850)
+    trace = {
+        "model_hash": hashlib.sha256(f"model-{i % 4}".encode()).hexdigest(),
+        "input_hash": hashlib.sha256(f"input-{i}".encode()).hexdigest(),
+        "public_input": json.dumps({"applicant_id": i, "income": "REDACTED_ZKP_VERIFIED", "score": "REDACTED_ZKP_VERIFIED"}),
+        "zkp_proofs": ["ZKP: Score >= 700 Verified", "ZKP: Income >= 40000 Verified"],
+        "constraints": {"max_input_length": 2048, "privacy": {"min_score": 700, "min_income": 40000, "age_limit": 18}},
+        "output": f"SYS: {'LOAN_APPROVED' if score >= 700 else 'LOAN_DENIED'} | SCORE: {score}",
+        "execution_time_ms": random.randint(80, 140),
+        "executed_at": time.time(),
+        "model_name": random.choice(["loan_approval_v1", "loan_approval_v2", "fraud_screen"])
+    }
+    content = canonical_bytes(generator.generate_proof(trace))
+    return f"QmMock{hashlib.sha256(content).hexdigest()[:40]}", content
+
+def allocated(root):
+    files, size = 0, 0
+    for path in Path(root).rglob("*"):
+        if path.is_file():
+            files += 1
+            size += os.stat(path).st_blocks * 512
+    return files, size
+
+proofs = [make_proof(i) for i in range(N_PROOFS)]
+raw_bytes = sum(len(content) for _, content in proofs)
+reads = [random.choice(proofs)[0] for _ in range(N_READS)]
+
+print(f"--- PROOF STORAGE BENCHMARK ({N_PROOFS} proofs, {raw_bytes / 1024:.0f} KiB of JSON, {N_READS} random reads) ---")
+print(f"{'layout':<28} {'files':>6} {'on disk':>10} {'vs JSON':>8} {'write':>8} {'read p50':>9} {'read p99':>9}")
+
+with tempfile.TemporaryDirectory() as tmp:
+    dictionary = build_dictionary(content for _, content in proofs[:16])
+    layouts = [
+        ("one file per proof", lambda root: LocalProofStore(root)),
+        ("packfile (zlib)", lambda root: PackfileProofStore(root)),
+        ("packfile (zlib + zdict)", lambda root: PackfileProofStore(root, dictionary=dictionary)),
+    ]
+    for label, factory in layouts:
+        root = os.path.join(tmp, label.replace(" ", "_"))
+        store = factory(root)
+        start = time.perf_counter()
+        for cid, content in proofs:
+            store.put(cid, content)
+        write_s = time.perf_counter() - start
+
+        latencies = []
+        for cid in reads:
+            t = time.perf_counter()
+            store.get(cid)
+            latencies.append((time.perf_counter() - t) * 1e6)
+        store.close()
+
+        files, size = allocated(root)
+        p99 = statistics.quantiles(latencies, n=100)[98]
+        print(f"{label:<28} {files:>6} {size / 1024:>8.0f}Ki {size / raw_bytes:>7.2f}x {write_s:>7.2f}s {statistics.median(latencies):>7.1f}us {p99:>7.1f}us")
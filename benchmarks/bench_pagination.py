@@ -0,0 +1,89 @@
+"""
+Page latency of the keyset-paginated listings as the table grows.
+
+Seeds a fresh SQLite database in a temp directory in steps up to each size
+(mostly PENDING rows, some expired IN_PROGRESS leases, the rest VERIFIED). At
+each size it times the first page and a page from the middle of
+/api/requests and /api/queue. It also times the queue's former single-query
+form (PENDING OR expired lease), which SQLite can only serve by sorting every
+match. Listing latency should stay flat as the table grows.
+
+Run from the repository root:
+    python -m benchmarks.bench_pagination [rows ...] [--page-size N]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+args = sys.argv[1:]
+PAGE_SIZE = 100
+if "--page-size" in args:
+    i = args.index("--page-size")
+    PAGE_SIZE = int(args[i + 1])
+    del args[i:i + 2]
+SIZES = [int(a) for a in args] or [2000, 200000]
+REPEATS = 20
+
+tmp = tempfile.TemporaryDirectory()
+os.chdir(tmp.name)  # The API's SQLite database is created relative to the working directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import and_, or_
+
+from sentinel.api import server
+from sentinel.api.pagination import encode_cursor, keyset_page
+from sentinel.models import SessionLocal, VerificationRequest, init_db
+
+init_db()  # Normally run by the app lifespan; the routes are called directly here
+db = SessionLocal()
+
+def seed(start: int, stop: int):
+    base = datetime.utcnow() - timedelta(days=30)
+    expired = datetime.utcnow() - timedelta(hours=1)
+    rows = []
+    for i in range(start, stop):
+        status = "PENDING" if i % 10 < 8 else "IN_PROGRESS" if i % 100 == 8 else "VERIFIED"
+        rows.append({"req_uuid": f"seed-{i}", "requester_id": 1 + i % 3, "model_name": "loan_approval_v1",
+                     "input_context": f"Loan Application #{i}", "status": status, "created_at": base + timedelta(seconds=i),
+                     "lease_id": "stale" if status == "IN_PROGRESS" else None,
+                     "lease_expires_at": expired if status == "IN_PROGRESS" else None})
+    for i in range(0, len(rows), 50000):
+        db.bulk_insert_mappings(VerificationRequest, rows[i:i + 50000])
+        db.commit()
+
+def single_or_queue(cursor):
+    # The queue as one query: PENDING OR an expired lease
+    expired = and_(VerificationRequest.status == "IN_PROGRESS", VerificationRequest.lease_expires_at < datetime.utcnow())
+    query = db.query(*server.REQUEST_SUMMARY_COLUMNS).filter(or_(VerificationRequest.status == "PENDING", expired))
+    return keyset_page(query, VerificationRequest, cursor, PAGE_SIZE)
+
+def timed_ms(fn) -> float:
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+routes = [
+    ("GET /api/requests", lambda cursor: server.get_my_requests(username="alice_risk", limit=PAGE_SIZE, cursor=cursor, db=db)),
+    ("GET /api/queue", lambda cursor: server.get_pending_queue(limit=PAGE_SIZE, cursor=cursor, db=db)),
+    ("queue as one OR query", single_or_queue),
+]
+
+print(f"--- PAGINATION SCALING BENCHMARK (pages of {PAGE_SIZE}, median of {REPEATS}) ---")
+print(f"{'rows':>8} {'route':<24} {'first page ms':>14} {'mid page ms':>12}")
+seeded = 0
+for size in SIZES:
+    seed(seeded, size)
+    seeded = size
+    # A cursor halfway through the table (by creation time)
+    mid = db.query(VerificationRequest.created_at, VerificationRequest.id).filter(VerificationRequest.req_uuid == f"seed-{size // 2}").one()
+    mid_cursor = encode_cursor(mid.created_at, mid.id)
+    for label, page in routes:
+        first = timed_ms(lambda: page(None))
+        middle = timed_ms(lambda: page(mid_cursor))
+        print(f"{size:>8} {label:<24} {first:>14.1f} {middle:>12.1f}")
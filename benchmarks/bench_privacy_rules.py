@@ -0,0 +1,44 @@
+"""
+Compares per-record PrivacyEngine.apply_privacy_rules with the columnar batch mode.
+
+Run from the repository root:
+    python -m benchmarks.bench_privacy_rules [n_records]
+"""
+import json
+import random
+import sys
+import time
+
+from sentinel.core import constraints
+from sentinel.core.constraints import PrivacyEngine
+
+N_RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+rules = {
+    "min_score": 700,
+    "min_income": 40000,
+    "age_limit": 18,
+    "rules": [{"field": "debt_ratio", "op": "<", "value": 0.4, "label": "Debt-to-income"}]
+}
+random.seed(7)
+records = [json.dumps({
+    "applicant_id": i,
+    "score": random.randint(300, 850),
+    "income": random.randint(10000, 200000),
+    "age": random.randint(16, 80),
+    "debt_ratio": round(random.random(), 3)
+}) for i in range(N_RECORDS)]
+
+print(f"--- PRIVACY RULE BENCHMARK ({N_RECORDS} records, NumPy {'on' if constraints.np is not None else 'off'}) ---")
+
+start = time.perf_counter()
+single = [PrivacyEngine.apply_privacy_rules(r, rules) for r in records]
+single_elapsed = time.perf_counter() - start
+print(f"Per-record:  {single_elapsed:7.3f}s  {N_RECORDS / single_elapsed:10.0f} records/s")
+
+start = time.perf_counter()
+batch = PrivacyEngine.apply_privacy_rules_batch(records, rules)
+batch_elapsed = time.perf_counter() - start
+print(f"Columnar:    {batch_elapsed:7.3f}s  {N_RECORDS / batch_elapsed:10.0f} records/s")
+
+print(f"Outputs identical: {single == batch}")
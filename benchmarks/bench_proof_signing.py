@@ -0,0 +1,43 @@
+"""
+Compares per-trace signing (generate_proof) with Merkle batch signing (generate_proofs).
+
+Run from the repository root:
+    python -m benchmarks.bench_proof_signing [n_traces]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from sentinel.core.identity import DIDManager
+from sentinel.core.proof import ProofGenerator
+
+N_TRACES = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+traces = [{
+    "model_hash": "99aef214ca9fb7a2c734f1c4d00821d1b839626d0f73668bd9aea005b6419783",
+    "input_hash": f"{i:064x}",
+    "public_input": '{"income": "REDACTED_ZKP_VERIFIED", "score": "REDACTED_ZKP_VERIFIED"}',
+    "zkp_proofs": ["ZKP: Score >= 700 Verified", "ZKP: Income >= 40000 Verified"],
+    "constraints": {"max_input_length": 2048, "privacy": {"min_score": 700, "min_income": 40000}},
+    "output": "SYS: LOAN_APPROVED",
+    "execution_time_ms": 100,
+    "executed_at": 1768890263.0 + i
+} for i in range(N_TRACES)]
+
+with tempfile.TemporaryDirectory() as tmp:
+    generator = ProofGenerator(DIDManager(os.path.join(tmp, "bench_key.pem")))
+
+    print(f"--- PROOF SIGNING BENCHMARK ({N_TRACES} traces) ---")
+
+    start = time.perf_counter()
+    single = [generator.generate_proof(t) for t in traces]
+    single_elapsed = time.perf_counter() - start
+    print(f"One signature per trace: {single_elapsed:7.3f}s  {N_TRACES / single_elapsed:9.0f} proofs/s")
+
+    start = time.perf_counter()
+    batch = generator.generate_proofs(traces)
+    batch_elapsed = time.perf_counter() - start
+    print(f"Merkle batch signature:  {batch_elapsed:7.3f}s  {N_TRACES / batch_elapsed:9.0f} proofs/s")
+
+    print(f"Speedup: {single_elapsed / batch_elapsed:.1f}x, all batch proofs verify: {all(ProofGenerator.verify_proof(p) for p in batch)}")
@@ -0,0 +1,41 @@
+"""
+Replays a stream of loan applications with resubmissions, with and without the
+deterministic result cache, and reports hit rate and model latency saved.
+
+Run from the repository root:
+    python -m benchmarks.bench_result_cache [n_requests] [distinct_inputs]
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from sentinel.core.cache import ResultCache
+from sentinel.core.runtime import SecureRuntime
+
+N_REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+DISTINCT = int(sys.argv[2]) if len(sys.argv) > 2 else 80
+
+random.seed(3)
+applications = [json.dumps({"applicant_id": i, "score": 700 + i % 100, "income": 50000}) for i in range(DISTINCT)]
+stream = [random.choice(applications) for _ in range(N_REQUESTS)]
+constraints = {"max_input_length": 2048, "privacy": {"min_score": 700}}
+
+with tempfile.TemporaryDirectory() as tmp:
+    model_path = os.path.join(tmp, "bench_model.bin")
+    with open(model_path, "wb") as f:
+        f.write(os.urandom(1024))
+
+    print(f"--- RESULT CACHE BENCHMARK ({N_REQUESTS} requests over {DISTINCT} distinct applications) ---")
+    for label, cache in [("no cache", None), ("memory + disk cache", ResultCache(disk_path=os.path.join(tmp, "results.db")))]:
+        runtime = SecureRuntime(model_path, use_hash_cache=False, result_cache=cache)
+        start = time.perf_counter()
+        for data in stream:
+            runtime.execute(data, constraints)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<20} {elapsed:7.2f}s  {N_REQUESTS / elapsed:8.1f} req/s")
+        if cache:
+            stats = cache.stats()
+            print(f"{'':<20} hit rate {stats['hit_rate']:.0%}, model latency saved {stats['saved_ms'] / 1000:.2f}s")
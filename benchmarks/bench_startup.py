@@ -0,0 +1,114 @@
+"""
+Cold-start cost of the argus CLI and the API server.
+
+Prints a `python -X importtime` summary (the slowest direct imports) for
+`sentinel.cli` and `sentinel.api.server`, then the wall-clock time of
+`python -m sentinel.cli verify <proof.json>` on a locally signed proof, next
+to bare interpreter startup.
+
+Also guards against regressions: exits with status 1 if `verify` on a local
+file pulls in any module it does not need (the model runtime, numpy, HTTP
+client, database or web framework), or if its median wall-clock exceeds the
+optional budget.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup [runs] [verify_budget_ms]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RUNS = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+VERIFY_BUDGET_MS = float(sys.argv[2]) if len(sys.argv) > 2 else None
+TOP = 8
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# Verifying a proof that is already on disk needs none of these
+VERIFY_FORBIDDEN = ["sentinel.core.runtime", "numpy", "requests", "sqlalchemy", "fastapi", "qrcode"]
+
+def run_python(args, cwd):
+    # The API's SQLite database is created relative to the working directory, so stay out of the repo
+    env = {**os.environ, "PYTHONPATH": REPO_ROOT}
+    return subprocess.run([sys.executable, *args], cwd=cwd, env=env, capture_output=True, text=True)
+
+def importtime(args, cwd):
+    """
+    Returns {module: (self_us, cumulative_us, depth)} from a `-X importtime` run.
+    """
+    result = run_python(["-X", "importtime", *args], cwd)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules, result
+
+def report_imports(target, cwd):
+    modules, result = importtime(["-c", f"import {target}"], cwd)
+    if result.returncode != 0:
+        print(f"import {target} failed:\n{result.stderr[-2000:]}")
+        return
+    total = modules[target][1]
+    direct = sorted(((cumulative, name) for name, (_, cumulative, depth) in modules.items() if depth == 1), reverse=True)
+    print(f"\nimport {target}: {total / 1000:.1f} ms, {len(modules)} modules")
+    for cumulative, name in direct[:TOP]:
+        print(f"  {name:<40} {cumulative / 1000:8.1f} ms")
+
+def wall_clock(args, cwd):
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = run_python(args, cwd)
+        samples.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            raise SystemExit(f"{' '.join(args)} exited with {result.returncode}:\n{result.stdout[-2000:]}{result.stderr[-2000:]}")
+    return statistics.median(samples), min(samples)
+
+if __name__ == "__main__":
+    from sentinel.core.identity import DIDManager
+    from sentinel.core.proof import ProofGenerator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        proof_path = os.path.join(tmp, "proof.json")
+        generator = ProofGenerator(DIDManager(os.path.join(tmp, "bench_key.pem")))
+        with open(proof_path, "w") as f:
+            json.dump(generator.generate_proof({
+                "model_hash": "99aef214ca9fb7a2c734f1c4d00821d1b839626d0f73668bd9aea005b6419783",
+                "input_hash": "0" * 64,
+                "public_input": "Loan Application",
+                "zkp_proofs": [],
+                "constraints": {"max_input_length": 2048},
+                "output": "SYS: LOAN_APPROVED",
+                "execution_time_ms": 100,
+                "executed_at": 1768890263.0
+            }), f)
+
+        print(f"--- STARTUP BENCHMARK ({RUNS} runs per command) ---")
+        report_imports("sentinel.cli", tmp)
+        report_imports("sentinel.api.server", tmp)
+
+        print(f"\n{'command':<40} {'median ms':>10} {'min ms':>8}")
+        for label, args in [
+            ("python -c pass", ["-c", "pass"]),
+            ("argus --help", ["-m", "sentinel.cli", "--help"]),
+            ("argus verify proof.json", ["-m", "sentinel.cli", "verify", proof_path]),
+        ]:
+            median, fastest = wall_clock(args, tmp)
+            print(f"{label:<40} {median:>10.1f} {fastest:>8.1f}")
+
+        verify_modules, _ = importtime(["-m", "sentinel.cli", "verify", proof_path], tmp)
+
+    failures = [f"verify imported {name}" for name in VERIFY_FORBIDDEN if name in verify_modules]
+    if VERIFY_BUDGET_MS is not None and median > VERIFY_BUDGET_MS:
+        failures.append(f"verify took {median:.1f} ms (budget {VERIFY_BUDGET_MS:.1f} ms)")
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    sys.exit(1 if failures else 0)
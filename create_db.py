@@ -1,10 +1,20 @@
 from database.connection import engine, SessionLocal
+from sqlalchemy import inspect
 from database.models import Base, Department, User, ModelRegistry
 # Import all models so Base.metadata can find them
 
 def init_db():
     print("Creating tables...")
     Base.metadata.create_all(bind=engine)
+    # Existing databases get any columns and indexes added to the models since they were created
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspect(engine).get_columns(table.name)}
+        with engine.begin() as conn:
+            for column in table.columns:
+                if column.name not in existing:
+                    conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD {column.name} {column.type.compile(dialect=engine.dialect)}")
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
     print("Tables created successfully.")
 
 def seed_data():
@@ -1,6 +1,6 @@
 import os
 import urllib
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 # -----------------------------------------------------------------------------
@@ -31,7 +31,30 @@ else:
     DATABASE_URL = f"sqlite:///{DB_PATH}"
     print(f"Connecting to SQLite: {DB_PATH}")
 
-engine = create_engine(DATABASE_URL, echo=True) # echo=True prints SQL queries to console
+# Connection pool sized for the API's worker threads; override per deployment
+DB_POOL_SIZE = int(os.getenv("ARGUS_DB_POOL_SIZE", "16"))
+DB_MAX_OVERFLOW = int(os.getenv("ARGUS_DB_MAX_OVERFLOW", "16"))
+# ARGUS_DB_ECHO=0 silences the SQL log, which costs a console write per query under load
+DB_ECHO = os.getenv("ARGUS_DB_ECHO", "1") == "1"
+
+if DB_TYPE == "MSSQL":
+    # pre_ping drops connections the server closed; recycle stays under typical idle timeouts
+    engine = create_engine(DATABASE_URL, echo=DB_ECHO, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW,
+                           pool_pre_ping=True, pool_recycle=1800)
+else:
+    engine = create_engine(DATABASE_URL, echo=DB_ECHO, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW,
+                           connect_args={"check_same_thread": False, "timeout": 30})
+
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")  # Readers and the writer don't block each other
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=30000")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
 
 # -----------------------------------------------------------------------------
 # SESSION FACTORY
@@ -1,6 +1,6 @@
 import uuid
 import datetime
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Text
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Text, Index
 from sqlalchemy.orm import DeclarativeBase, relationship
 from sqlalchemy.dialects.postgresql import UUID # Compatible with other dialects via generic types if careful, better to use standard type decorator for cross-compat if needed, but for now we'll use string or TypeDecorator for UUID in SQLite.
 # For simplicity and cross-compatibility (SQLite doesn't have native UUID), we will use String for UUIDs in this implementation 
@@ -58,16 +58,28 @@ class VerificationRequest(Base):
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     input_context = Column(Text, nullable=False) # e.g. "Loan App #12345"
-    status = Column(String(20), default="PENDING") # PENDING, VERIFIED, FLAGGED
+    status = Column(String(20), default="PENDING", index=True) # PENDING, IN_PROGRESS, VERIFIED, FLAGGED
     proof_cid = Column(String(200), nullable=True) # IPFS content ID of the proof
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
+
+    # Job lease held by a Sentinel node while the request is IN_PROGRESS
+    lease_owner = Column(String(100), nullable=True) # Node ID
+    lease_id = Column(String(36), nullable=True) # Token the holder must present to complete
+    lease_expires_at = Column(DateTime, nullable=True)
     
-    requester_id = Column(Integer, ForeignKey("users.id"))
+    requester_id = Column(Integer, ForeignKey("users.id"), index=True)
     model_id = Column(Integer, ForeignKey("model_registry.id"))
     
     # Relationships
     requester = relationship("User", back_populates="requests")
     model = relationship("ModelRegistry", back_populates="verification_requests")
 
+    # Composite indexes for keyset-paginated listings: filter column, then (created_at, id)
+    __table_args__ = (
+        Index("ix_verification_requests_status_created", "status", "created_at", "id"),
+        Index("ix_verification_requests_requester_created", "requester_id", "created_at", "id"),
+        Index("ix_verification_requests_status_lease", "status", "lease_expires_at"),
+    )
+
     def __repr__(self):
         return f"<Request(id='{self.id}', status='{self.status}')>"
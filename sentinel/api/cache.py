@@ -0,0 +1,119 @@
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from sentinel.core.proof import ProofGenerator
+
+class ProofCache:
+    """
+    LRU of fetched proofs and their verification verdicts, keyed by CID.
+    Content under a CID never changes, so entries need no TTL; they are only
+    evicted to stay within max_entries and max_bytes.
+    Concurrent misses for the same CID share a single fetch + verify.
+    Only found proofs are cached: a CID missing now (e.g. still in a
+    write-behind backlog) may resolve on the next request.
+    """
+    def __init__(self, fetch: Callable[[str], Optional[Dict[str, Any]]], max_entries: int = 4096, max_bytes: int = 64 * 1024 * 1024):
+        self.fetch = fetch
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # cid -> rendered response body ({"proof": ..., "is_valid": ...})
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    async def get(self, cid: str) -> Optional[bytes]:
+        """
+        Returns the JSON response body for cid, or None if no proof exists.
+        """
+        with self._lock:
+            body = self._entries.get(cid)
+            if body is not None:
+                self._entries.move_to_end(cid)
+                self.hits += 1
+                return body
+
+        pending = self._inflight.get(cid)
+        if pending is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only the leader's request was cancelled (e.g. its client disconnected): fetch it ourselves
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                return await self.get(cid)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cid] = future
+        try:
+            body = await run_in_threadpool(self._load, cid)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody else awaited is not logged as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(body)
+        finally:
+            # Cancellation (a BaseException) skips both branches above; never leave waiters hanging
+            if not future.done():
+                future.cancel()
+            del self._inflight[cid]
+
+        if body is not None:
+            self._remember(cid, body)
+        return body
+
+    def _load(self, cid: str) -> Optional[bytes]:
+        proof = self.fetch(cid)
+        if not proof:
+            return None
+        is_valid = ProofGenerator.verify_proof(proof)
+        return json.dumps({"proof": proof, "is_valid": is_valid}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def _remember(self, cid: str, body: bytes):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if cid in self._entries:
+                return
+            self._entries[cid] = body
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def invalidate(self, cid: str):
+        with self._lock:
+            body = self._entries.pop(cid, None)
+            if body is not None:
+                self._bytes -= len(body)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple, Union
+
+class EventChannel:
+    """
+    Sequenced, bounded in-memory event stream with async waiters.
+    Every published event gets the next sequence number; subscribers resume
+    after the last sequence they saw. Only the newest `capacity` events are
+    retained, so a subscriber that falls further behind than that skips ahead.
+    publish() is safe to call from the event loop or from worker threads.
+
+    With log_path, every event is also appended to a JSON-lines log that is
+    replayed on startup, so the retained events and the sequence numbering
+    survive a restart. The log is rewritten down to the retained events once
+    it holds twice the capacity, so it stays bounded too.
+    """
+    def __init__(self, name: str, capacity: int = 1000, log_path: Optional[Union[str, Path]] = None):
+        self.name = name
+        self.capacity = capacity
+        self._events: Deque[Tuple[int, Dict[str, Any]]] = deque(maxlen=capacity)
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+        self.log_path = Path(log_path) if log_path else None
+        self._log = None
+        self._log_lines = 0
+        if self.log_path:
+            self._replay()
+            self._log = open(self.log_path, "a", encoding="utf-8")
+
+    def _replay(self):
+        if not self.log_path.exists():
+            return
+        valid_end = 0
+        with open(self.log_path, "rb") as f:
+            for line in f:
+                try:
+                    seq, data = json.loads(line)
+                except ValueError:
+                    break  # Torn last line from a crash mid-write
+                if not line.endswith(b"\n"):
+                    break
+                self._events.append((seq, data))
+                self._seq = max(self._seq, seq)
+                self._log_lines += 1
+                valid_end += len(line)
+        # Drop the torn tail so the next append starts on a fresh line
+        if self.log_path.stat().st_size != valid_end:
+            os.truncate(self.log_path, valid_end)
+
+    def _compact_log(self):
+        # Rewrite with only the retained events, then swap it in atomically
+        tmp_path = self.log_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for event in self._events:
+                f.write(json.dumps(event, default=str) + "\n")
+        self._log.close()
+        os.replace(tmp_path, self.log_path)
+        self._log = open(self.log_path, "a", encoding="utf-8")
+        self._log_lines = len(self._events)
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def publish(self, data: Dict[str, Any]) -> int:
+        with self._lock:
+            self._seq += 1
+            self._events.append((self._seq, data))
+            if self._log:
+                self._log.write(json.dumps((self._seq, data), default=str) + "\n")
+                self._log.flush()
+                self._log_lines += 1
+                if self._log_lines >= 2 * self.capacity:
+                    self._compact_log()
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(self._wake, future)
+        return self._seq
+
+    @staticmethod
+    def _wake(future: asyncio.Future):
+        if not future.done():
+            future.set_result(None)
+
+    def since(self, seq: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Events with a sequence number greater than seq, oldest first.
+        """
+        with self._lock:
+            if not self._events or seq >= self._seq:
+                return []
+            # Sequence numbers are contiguous, so the start position is computed, not searched
+            start = max(0, seq - self._events[0][0] + 1)
+            return [self._events[i] for i in range(start, len(self._events))]
+
+    def latest(self, limit: int, since: Optional[int] = None) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Up to limit events after since (or the newest ones), newest first.
+        Walks back from the head, so the cost is O(events returned).
+        """
+        found = []
+        with self._lock:
+            for seq, data in reversed(self._events):
+                if len(found) >= limit or (since is not None and seq <= since):
+                    break
+                found.append((seq, data))
+        return found
+
+    async def wait(self, seq: int, timeout: float) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Returns events after seq, waiting up to timeout seconds for the first one.
+        """
+        events = self.since(seq)
+        if events or timeout <= 0:
+            return events
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            # Re-check under the lock so a publish between since() and here is not missed
+            if seq < self._seq:
+                future.set_result(None)
+            else:
+                self._waiters.append((loop, future))
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if (loop, future) in self._waiters:
+                    self._waiters.remove((loop, future))
+        return self.since(seq)
+
+    async def stream(self, seq: int, heartbeat: float = 15.0) -> AsyncIterator[str]:
+        """
+        Server-sent events after seq, forever. Each event's id is its sequence number,
+        so a reconnecting EventSource resumes via Last-Event-ID; comment lines keep
+        idle connections (and proxies) alive.
+        """
+        yield "retry: 1000\n\n"
+        while True:
+            events = await self.wait(seq, heartbeat)
+            if not events:
+                yield f": keepalive {int(time.time())}\n\n"
+                continue
+            for event_seq, data in events:
+                yield f"id: {event_seq}\nevent: {self.name}\ndata: {json.dumps(data, default=str)}\n\n"
+                seq = event_seq
+
+def resume_point(channel: EventChannel, since: Optional[int], last_event_id: Optional[str]) -> int:
+    """
+    Where a subscriber starts: an explicit `since`, else the Last-Event-ID of a reconnect,
+    else only events published from now on. A position past the head means the server
+    restarted and numbering began again, so the subscriber replays what is retained.
+    """
+    seq = since
+    if seq is None and last_event_id:
+        try:
+            seq = int(last_event_id)
+        except ValueError:
+            pass
+    if seq is None:
+        return channel.seq
+    return seq if 0 <= seq <= channel.seq else 0
@@ -0,0 +1,61 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+def encode_cursor(created_at: datetime, row_id: Any) -> str:
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), row_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_page(query: Query, model: Any, cursor: Optional[str], limit: int, descending: bool = False) -> Tuple[List[Any], Optional[str]]:
+    """
+    Returns one page of query ordered by (created_at, id) plus the cursor for the next page
+    (None on the last page). Each page is an index range scan that starts after the cursor,
+    so its cost does not grow with how deep into the table the page is.
+    """
+    return keyset_page_union([query], model, cursor, limit, descending)
+
+def keyset_page_union(queries: List[Query], model: Any, cursor: Optional[str], limit: int, descending: bool = False) -> Tuple[List[Any], Optional[str]]:
+    """
+    Like keyset_page over the union of several disjoint queries. Instead of one query
+    with an OR (which the database can't serve in index order, so it sorts every match),
+    each query is its own index range scan and the pages are merged here.
+    """
+    created_at, row_id = model.created_at, model.id
+    after = decode_cursor(cursor) if cursor else None
+    order = (created_at.desc(), row_id.desc()) if descending else (created_at.asc(), row_id.asc())
+
+    rows = []
+    for query in queries:
+        if after:
+            after_created, after_id = after
+            # Expanded row-value comparison, portable to databases without (a, b) > (x, y).
+            # The redundant plain bound on created_at is what lets the index seek to the cursor;
+            # the OR alone is not sargable and makes the scan start from the first row.
+            if descending:
+                query = query.filter(created_at <= after_created,
+                                     or_(created_at < after_created, and_(created_at == after_created, row_id < after_id)))
+            else:
+                query = query.filter(created_at >= after_created,
+                                     or_(created_at > after_created, and_(created_at == after_created, row_id > after_id)))
+        # One extra row tells us whether another page exists without a COUNT
+        rows.extend(query.order_by(*order).limit(limit + 1).all())
+
+    if len(queries) > 1:
+        rows.sort(key=lambda row: (row.created_at, row.id), reverse=descending)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
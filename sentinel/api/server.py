@@ -1,24 +1,43 @@
 import json
+import os
+import threading
 import time
 import uuid
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from functools import wraps
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Query, Header
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
 
-from sqlalchemy.orm import Session
-from sentinel.storage.ipfs import IPFSStorage
-from sentinel.core.proof import ProofGenerator
-from sentinel.models import init_db, SessionLocal, User, VerificationRequest, Department
+from anyio import to_thread
+from sqlalchemy import and_, bindparam, func, insert, or_, select, update
+from sqlalchemy.orm import Session, joinedload
+from sentinel.api.cache import ProofCache
+from sentinel.api.pagination import keyset_page, keyset_page_union
+from sentinel.api.events import EventChannel, resume_point
+from sentinel.api.responses import FastJSONResponse
+from sentinel.models import init_db, SessionLocal, User, VerificationRequest, Department, DB_POOL_SIZE, DB_MAX_OVERFLOW
 
-# Initialize DB on startup
-init_db()
+# Database routes are plain `def`, so FastAPI runs them on the worker thread pool and a
+# slow query never blocks the event loop (feed, SSE and proof routes stay responsive).
+# Enough threads for every pooled connection, and no more, so none waits for a connection.
+API_THREADS = int(os.getenv("ARGUS_API_THREADS", DB_POOL_SIZE + DB_MAX_OVERFLOW))
 
-app = FastAPI(title="Argus API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    to_thread.current_default_thread_limiter().total_tokens = API_THREADS
+    # Schema upgrades, seeding and the feed log replay run when the server starts, not on import
+    await to_thread.run_sync(init_db)
+    await to_thread.run_sync(get_event_channels)
+    yield
+
+app = FastAPI(title="Argus API", lifespan=lifespan)
 
 # CORS for frontend dev
 app.add_middleware(
@@ -27,12 +46,40 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
-storage = IPFSStorage()
+def built_on_first_use(factory):
+    """
+    Calls factory once, on first use (even when first used from several threads at once),
+    and returns the same object from then on.
+    """
+    lock = threading.Lock()
+    built = []
 
-# In-memory event log for live feed (Legacy support)
-latest_events = []
+    @wraps(factory)
+    def get():
+        if not built:
+            with lock:
+                if not built:
+                    built.append(factory())
+        return built[0]
+    return get
+
+@built_on_first_use
+def get_proof_cache() -> ProofCache:
+    # Proofs are immutable by CID: keep fetched proofs and their verdicts in memory
+    from sentinel.storage.ipfs import IPFSStorage  # Only proof routes need the HTTP client
+    return ProofCache(IPFSStorage().get_proof)
+
+@built_on_first_use
+def get_event_channels() -> Dict[str, EventChannel]:
+    # Push channels: new requests for Sentinel nodes, broadcast proofs for dashboards.
+    # The feed is a sequenced ring buffer; set ARGUS_FEED_LOG to keep it across restarts.
+    return {
+        "queue": EventChannel("queue"),
+        "feed": EventChannel("feed", capacity=int(os.getenv("ARGUS_FEED_CAPACITY", "1000")), log_path=os.getenv("ARGUS_FEED_LOG")),
+    }
 
 # Dependency
 def get_db():
@@ -57,6 +104,29 @@ class LoginRequest(BaseModel):
     username: str
     password: str
 
+class RequestSummary(BaseModel):
+    """
+    One row of a request listing. Listings select exactly these columns (no ORM
+    entities, no lease bookkeeping) and encode them without jsonable_encoder.
+    """
+    id: int
+    req_uuid: str
+    requester_id: Optional[int] = None
+    model_name: Optional[str] = None
+    input_context: Optional[str] = None
+    status: str
+    proof_cid: Optional[str] = None
+    created_at: datetime
+
+REQUEST_SUMMARY_COLUMNS = [getattr(VerificationRequest, field) for field in RequestSummary.model_fields]
+
+def summarize(rows) -> List[dict]:
+    return [row._asdict() for row in rows]
+
+def listing_response(rows, next_cursor: Optional[str]) -> FastJSONResponse:
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return FastJSONResponse(summarize(rows), headers=headers)
+
 # --- API Routes ---
 
 @app.get("/")
@@ -72,8 +142,9 @@ async def read_portal_alias():
      return FileResponse(web_dir / "portal.html")
 
 @app.post("/api/login")
-async def login(login_req: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.username == login_req.username).first()
+def login(login_req: LoginRequest, db: Session = Depends(get_db)):
+    # Department is loaded in the same query instead of lazily afterwards
+    user = db.query(User).options(joinedload(User.department)).filter(User.username == login_req.username).first()
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
@@ -81,10 +152,10 @@ async def login(login_req: LoginRequest, db: Session = Depends(get_db)):
     if user.password_hash != login_req.password:
          raise HTTPException(status_code=401, detail="Invalid credentials")
          
-    return {"id": user.id, "username": user.username, "role": user.role, "full_name": user.full_name, "department": user.department.name}
+    return {"id": user.id, "username": user.username, "role": user.role, "full_name": user.full_name, "department": user.department.name if user.department else None}
 
 @app.post("/api/request")
-async def create_request(req: RequestCreate, db: Session = Depends(get_db)):
+def create_request(req: RequestCreate, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.username == req.username).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -99,82 +170,293 @@ async def create_request(req: RequestCreate, db: Session = Depends(get_db)):
     db.add(new_req)
     db.commit()
     db.refresh(new_req)
+    get_event_channels()["queue"].publish({
+        "req_uuid": new_req.req_uuid,
+        "model_name": new_req.model_name,
+        "created_at": new_req.created_at.isoformat()
+    })
     return {"status": "created", "uuid": new_req.req_uuid}
 
-@app.get("/api/requests")
-async def get_my_requests(username: str, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.username == username).first()
+MAX_BATCH_SIZE = 5000
+
+def check_batch_size(items: list):
+    if len(items) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batch too large: at most {MAX_BATCH_SIZE} items")
+
+@app.post("/api/request/batch")
+def create_requests_batch(reqs: List[RequestCreate], db: Session = Depends(get_db)):
+    """
+    Creates many requests in one transaction: usernames are resolved with a single
+    query and rows are inserted in one executemany.
+    Returns one result per item, in order; unknown users fail only their own items.
+    """
+    check_batch_size(reqs)
+    usernames = {req.username for req in reqs}
+    user_ids = dict(db.query(User.username, User.id).filter(User.username.in_(usernames)).all()) if usernames else {}
+
+    now = datetime.utcnow()
+    rows, results = [], []
+    for req in reqs:
+        if req.username not in user_ids:
+            results.append({"status": "error", "status_code": 404, "detail": "User not found"})
+            continue
+        row = {
+            "req_uuid": str(uuid.uuid4()),
+            "requester_id": user_ids[req.username],
+            "model_name": req.model_name,
+            "input_context": req.input_context,
+            "status": "PENDING",
+            "created_at": now
+        }
+        rows.append(row)
+        results.append({"status": "created", "uuid": row["req_uuid"]})
+
+    if rows:
+        db.execute(insert(VerificationRequest.__table__), rows)
+        db.commit()
+        for row in rows:
+            get_event_channels()["queue"].publish({"req_uuid": row["req_uuid"], "model_name": row["model_name"], "created_at": now.isoformat()})
+    return {"created": len(rows), "results": results}
+
+@app.get("/api/requests", response_class=FastJSONResponse, responses={200: {"model": List[RequestSummary]}})
+def get_my_requests(username: str, limit: int = Query(100, ge=1, le=1000), cursor: Optional[str] = None, db: Session = Depends(get_db)):
+    """
+    Newest requests first, one page at a time.
+    Pass the X-Next-Cursor response header back as `cursor` for the next page.
+    """
+    query = visible_requests(db, username, *REQUEST_SUMMARY_COLUMNS)
+    reqs, next_cursor = keyset_page(query, VerificationRequest, cursor, limit, descending=True)
+    return listing_response(reqs, next_cursor)
+
+@app.get("/api/requests/summary")
+def get_my_requests_summary(username: str, db: Session = Depends(get_db)):
+    """
+    Request counts by status over everything the user can see (not just one page), for the portal's stat cards.
+    """
+    query = visible_requests(db, username, VerificationRequest.status, func.count(VerificationRequest.id))
+    by_status = dict(query.group_by(VerificationRequest.status).all())
+    return {"total": sum(by_status.values()), "by_status": by_status}
+
+def visible_requests(db: Session, username: str, *columns):
+    user = db.query(User.id, User.role).filter(User.username == username).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
     # RBAC Logic
     if user.role == "RISK_OFFICER":
         # Risk Officers see everything
-        reqs = db.query(VerificationRequest).all()
-    else:
-        # Traders see only their own
-        reqs = db.query(VerificationRequest).filter(VerificationRequest.requester_id == user.id).all()
-        
-    return reqs
+        return db.query(*columns)
+    # Traders see only their own
+    return db.query(*columns).filter(VerificationRequest.requester_id == user.id)
 
-@app.get("/api/queue")
-async def get_pending_queue(db: Session = Depends(get_db)):
+@app.get("/api/queue", response_class=FastJSONResponse, responses={200: {"model": List[RequestSummary]}})
+def get_pending_queue(limit: int = Query(100, ge=1, le=1000), cursor: Optional[str] = None, db: Session = Depends(get_db)):
     """
     Endpoint for the Sentinel Node to fetch pending verification requests.
+    Oldest first (FIFO); paginated like /api/requests.
+    Requests whose lease has expired are listed too, since the next lease reclaims them.
+    """
+    # Read-only: expired leases are reclaimed by /api/lease, so polling never takes the write lock.
+    # Two queries rather than one OR, so each is served in (status, created_at, id) index order.
+    pending = db.query(*REQUEST_SUMMARY_COLUMNS).filter(VerificationRequest.status == "PENDING")
+    expired = db.query(*REQUEST_SUMMARY_COLUMNS).filter(VerificationRequest.status == "IN_PROGRESS",
+                                                       VerificationRequest.lease_expires_at < datetime.utcnow())
+    reqs, next_cursor = keyset_page_union([pending, expired], VerificationRequest, cursor, limit)
+    return listing_response(reqs, next_cursor)
+
+def release_expired_leases(db: Session) -> int:
+    """
+    Returns IN_PROGRESS requests whose lease has expired (e.g. the node crashed) to the queue.
+    """
+    result = db.execute(
+        update(VerificationRequest)
+        .where(VerificationRequest.status == "IN_PROGRESS", VerificationRequest.lease_expires_at < datetime.utcnow())
+        .values(status="PENDING", lease_owner=None, lease_id=None, lease_expires_at=None)
+    )
+    db.commit()
+    if result.rowcount:
+        # Wake push-mode nodes: these jobs are available again
+        get_event_channels()["queue"].publish({"released": result.rowcount})
+    return result.rowcount
+
+class LeaseRequest(BaseModel):
+    node_id: str
+    limit: int = 1
+    lease_seconds: float = 60.0
+
+@app.post("/api/lease")
+def lease_requests(data: LeaseRequest, db: Session = Depends(get_db)):
+    """
+    Atomically claims up to `limit` of the oldest PENDING requests for a Sentinel node.
+    Claimed requests move to IN_PROGRESS until the lease expires; only the holder of
+    the returned lease_id can complete them. Expired leases go back to the queue first.
     """
-    # Fetch all PENDING requests
-    reqs = db.query(VerificationRequest).filter(VerificationRequest.status == "PENDING").all()
-    return reqs
+    if not 1 <= data.limit <= 1000:
+        raise HTTPException(status_code=422, detail="limit must be between 1 and 1000")
+    release_expired_leases(db)
+
+    lease_id = str(uuid.uuid4())
+    expires_at = datetime.utcnow() + timedelta(seconds=data.lease_seconds)
+    candidates = (
+        select(VerificationRequest.id)
+        .where(VerificationRequest.status == "PENDING")
+        .order_by(VerificationRequest.created_at, VerificationRequest.id)
+        .limit(data.limit)
+    )
+    # One UPDATE claims the batch; re-checking status in the outer WHERE means a row
+    # another node claimed concurrently is skipped instead of being claimed twice
+    db.execute(
+        update(VerificationRequest)
+        .where(VerificationRequest.id.in_(candidates.scalar_subquery()), VerificationRequest.status == "PENDING")
+        .values(status="IN_PROGRESS", lease_owner=data.node_id, lease_id=lease_id, lease_expires_at=expires_at)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+    reqs = (
+        db.query(*REQUEST_SUMMARY_COLUMNS)
+        .filter(VerificationRequest.lease_id == lease_id)
+        .order_by(VerificationRequest.created_at, VerificationRequest.id)
+        .all()
+    )
+    return FastJSONResponse({"lease_id": lease_id, "lease_expires_at": expires_at.isoformat(), "requests": summarize(reqs)})
 
 class CompletionRequest(BaseModel):
     req_uuid: str
     proof_cid: str
     status: str = "VERIFIED"
+    lease_id: Optional[str] = None
 
 @app.post("/api/complete")
-async def complete_request(data: CompletionRequest, db: Session = Depends(get_db)):
+def complete_request(data: CompletionRequest, db: Session = Depends(get_db)):
     """
     Endpoint for Sentinel Node to report completion.
+    A leased request can only be completed by its current lease holder; requests
+    that were never leased can still be completed without a lease_id.
     """
-    req = db.query(VerificationRequest).filter(VerificationRequest.req_uuid == data.req_uuid).first()
-    if not req:
-        raise HTTPException(status_code=404, detail="Request not found")
-    
-    req.status = data.status
-    req.proof_cid = data.proof_cid
+    # Lease check and write in one statement, so a lease reclaimed in between cannot slip through
+    holder = VerificationRequest.lease_id == data.lease_id if data.lease_id else VerificationRequest.lease_id.is_(None)
+    result = db.execute(
+        update(VerificationRequest)
+        .where(VerificationRequest.req_uuid == data.req_uuid, holder)
+        .values(status=data.status, proof_cid=data.proof_cid, lease_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
+
+    if result.rowcount == 0:
+        if not db.query(VerificationRequest.id).filter(VerificationRequest.req_uuid == data.req_uuid).first():
+            raise HTTPException(status_code=404, detail="Request not found")
+        raise HTTPException(status_code=409, detail="Request is leased by another node or the lease has been reclaimed")
     return {"status": "updated"}
 
+@app.post("/api/complete/batch")
+def complete_requests_batch(items: List[CompletionRequest], db: Session = Depends(get_db)):
+    """
+    Applies many completions with one parametrized UPDATE (executemany) in one transaction.
+    Each item is checked against its lease exactly like /api/complete.
+    Returns one result per item, in order.
+    """
+    check_batch_size(items)
+    if not items:
+        return {"updated": 0, "results": []}
+
+    table = VerificationRequest.__table__
+    lease = bindparam("b_lease_id")
+    db.execute(
+        update(table)
+        .where(table.c.req_uuid == bindparam("b_req_uuid"),
+               or_(table.c.lease_id == lease, and_(lease.is_(None), table.c.lease_id.is_(None))))
+        .values(status=bindparam("b_status"), proof_cid=bindparam("b_proof_cid"), lease_expires_at=None),
+        [{"b_req_uuid": item.req_uuid, "b_lease_id": item.lease_id, "b_status": item.status, "b_proof_cid": item.proof_cid} for item in items]
+    )
+    # Read back inside the same transaction: the write lock is held, so this is exactly what was applied
+    current = {
+        row.req_uuid: row
+        for row in db.execute(
+            select(table.c.req_uuid, table.c.lease_id, table.c.status, table.c.proof_cid)
+            .where(table.c.req_uuid.in_({item.req_uuid for item in items}))
+        )
+    }
+    db.commit()
+
+    results = []
+    for item in items:
+        row = current.get(item.req_uuid)
+        if row is None:
+            results.append({"req_uuid": item.req_uuid, "status": "error", "status_code": 404, "detail": "Request not found"})
+        elif row.lease_id == item.lease_id and row.status == item.status and row.proof_cid == item.proof_cid:
+            results.append({"req_uuid": item.req_uuid, "status": "updated"})
+        else:
+            results.append({"req_uuid": item.req_uuid, "status": "error", "status_code": 409,
+                            "detail": "Request is leased by another node or the lease has been reclaimed"})
+    return {"updated": sum(1 for r in results if r["status"] == "updated"), "results": results}
+
 @app.post("/api/broadcast")
 async def broadcast_proof(data: dict):
     """
     Receive a new proof/CID from the CLI and add it to the live feed.
     Legacy endpoint specific to CLI integration.
     """
-    global latest_events
     # Add timestamp server-side for sorting/filtering
     data["server_time"] = time.time()
-    latest_events.insert(0, data)
-    # Keep only last 10
-    latest_events = latest_events[:10]
-    return {"status": "broadcasted"}
+    seq = get_event_channels()["feed"].publish(data)
+    return {"status": "broadcasted", "seq": seq}
 
 @app.get("/api/feed")
-async def get_feed():
-    return latest_events
+async def get_feed(since: Optional[int] = None, limit: int = Query(10, ge=1, le=1000)):
+    """
+    Newest events first, each tagged with its sequence number.
+    Pass the highest seq seen as `since` to get only what is new.
+    """
+    feed = get_event_channels()["feed"]
+    if since is not None:
+        # Same rule as the event stream: a `since` past the head means the server restarted
+        # and numbering began again, so the poller gets what is retained instead of nothing
+        since = resume_point(feed, since, None)
+    return [{**data, "seq": seq} for seq, data in feed.latest(limit, since)]
+
+def get_channel(channel: str) -> EventChannel:
+    if channel not in get_event_channels():
+        raise HTTPException(status_code=404, detail=f"Unknown event channel: {channel}")
+    return get_event_channels()[channel]
+
+@app.get("/api/events/{channel}")
+async def stream_events(channel: str, since: Optional[int] = None, last_event_id: Optional[str] = Header(None)):
+    """
+    Server-sent events for a channel ("queue" or "feed").
+    Reconnecting clients resume from Last-Event-ID; `since` picks an explicit sequence number.
+    """
+    events = get_channel(channel)
+    start = resume_point(events, since, last_event_id)
+    return StreamingResponse(events.stream(start), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.get("/api/events/{channel}/poll")
+async def poll_events(channel: str, since: Optional[int] = None, timeout: float = Query(25.0, ge=0, le=60)):
+    """
+    Long-poll alternative to the event stream: returns as soon as there are events after
+    `since` (or after `timeout` seconds with none). Pass the returned seq as the next `since`.
+    """
+    events = get_channel(channel)
+    start = resume_point(events, since, None)
+    found = await events.wait(start, timeout)
+    return {
+        "seq": found[-1][0] if found else start,
+        "events": [{"seq": seq, "data": data} for seq, data in found]
+    }
+
+@app.get("/api/proof-cache/stats")
+async def get_proof_cache_stats():
+    return get_proof_cache().stats()
 
 @app.get("/api/proof/{cid}")
 async def get_proof(cid: str):
-    proof = storage.get_proof(cid)
-    if not proof:
+    # Fetched and verified once per CID, then served from memory
+    body = await get_proof_cache().get(cid)
+    if body is None:
         raise HTTPException(status_code=404, detail="Proof not found")
-    
-    # Verify it on the fly
-    is_valid = ProofGenerator.verify_proof(proof)
-    return {
-        "proof": proof,
-        "is_valid": is_valid
-    }
+    return Response(content=body, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,17 +1,14 @@
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.json import JSON
-from rich.progress import Progress, SpinnerColumn, TextColumn
 import json
 import os
+import socket
 import time
-import requests
 from pathlib import Path
-from sentinel.core.runtime import SecureRuntime
-from sentinel.storage.ipfs import IPFSStorage
-from sentinel.core.proof import ProofGenerator
+from typing import Optional
+
+# Each command imports what it needs: `verify` on a local file shouldn't pay for
+# the model runtime, numpy or the HTTP client at startup.
 
 app = typer.Typer(help="Argus: Decentralised AI Exec Proofs")
 console = Console()
@@ -34,6 +31,13 @@ def run(
     """
     Execute an AI task securely and generate a proof.
     """
+    from rich.json import JSON
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    import requests
+    from sentinel.core.runtime import SecureRuntime
+    from sentinel.storage.ipfs import IPFSStorage
+
     if not os.path.exists(model_path):
         console.print(f"[bold red]Error:[/bold red] Model file not found at {model_path}")
         raise typer.Exit(code=1)
@@ -74,6 +78,7 @@ def run(
 
     if simulate_tamper:
         console.print("[bold yellow]![/bold yellow] Simulating Tampering Attack...", style="yellow")
+        proof = proof.to_dict() # Issued credentials cache their serialization, so tamper with a plain copy
         proof['credentialSubject']['executionTrace']['output'] = "Evildoer was here"
         # Note: We modified the trace content but NOT the trace_hash in the proof wrapping
 
@@ -132,20 +137,81 @@ def run(
         except ImportError:
             pass
 
+# Every job a node runs is checked against these (privacy/ZKP enabled by default for the demo node)
+NODE_CONSTRAINTS = {
+    "max_input_length": 2048,
+    "privacy": {
+        "min_score": 700,
+        "min_income": 40000,
+        "age_limit": 18
+    }
+}
+
+def resolve_model_path(model_name: str, model_dir: str, default_model: str) -> Path:
+    """Maps a job's model_name to a scenario model file, falling back to the default model."""
+    candidate = Path(model_dir) / f"{model_name}.bin"
+    return candidate if candidate.exists() else Path(default_model)
+
 @app.command()
 def start_node(
     api_url: str = "http://127.0.0.1:8000",
-    interval: float = 3.0
+    interval: float = 3.0,
+    model_dir: str = typer.Option("scenarios", help="Directory of scenario models, looked up as <model_name>.bin"),
+    default_model: str = typer.Option("privacy_model.bin", help="Model used when a job names no known scenario model"),
+    memory_budget_mb: int = typer.Option(4096, help="Memory budget for warm models before LRU eviction"),
+    write_behind: bool = typer.Option(False, help="Return CIDs from local storage and upload to IPFS in the background"),
+    node_id: Optional[str] = typer.Option(None, help="Name this node uses to lease jobs (default: <hostname>-<pid>)"),
+    lease_seconds: float = typer.Option(60.0, help="How long a leased job stays reserved before other nodes may take it"),
+    push: bool = typer.Option(False, help="Wait on the API's queue event stream instead of polling every --interval seconds"),
+    workers: int = typer.Option(0, help="Headless production mode: run N jobs in parallel with pipelined upload and completion, no demo output"),
+    report_interval: float = typer.Option(10.0, help="Seconds between throughput and queue lag reports in --workers mode")
 ):
     """
     Starts the Sentinel Node in autonomous mode. 
-    Polls the API for pending verification requests and processes them.
+    Leases pending verification requests from the API and processes them.
+    Any number of nodes can share the queue: each job is leased to one node at a time.
+    With --workers N, jobs are leased in batches and processed N at a time without the demo animations.
     """
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    import requests
+    from sentinel.core.pool import ModelPool
+    from sentinel.storage.ipfs import IPFSStorage
+    from sentinel.storage.writebehind import WriteBehindUploader
+
+    node_id = node_id or f"{socket.gethostname()}-{os.getpid()}"
+    
+    # Scenario models stay warm between jobs; least recently used ones are evicted over budget
+    model_pool = ModelPool(memory_budget_bytes=memory_budget_mb * 1024 * 1024)
+    # One long-lived client: pooled keep-alive connections and a cached IPFS health check
+    storage = IPFSStorage()
+    # Write-behind: proofs are durable in a local WAL before the CID is used, IPFS adds are batched
+    uploader = WriteBehindUploader(storage).start() if write_behind else None
+    proof_sink = uploader if uploader else storage
+
+    if workers > 0:
+        from sentinel.node import HeadlessNode
+
+        def node_status() -> str:
+            pool_stats = model_pool.stats()
+            status = f"models warm: {pool_stats['loaded']}"
+            if uploader:
+                upload_stats = uploader.stats()
+                status += f" | upload backlog: {upload_stats['backlog']} oldest: {upload_stats['oldest_pending_s']}s"
+            return status
+
+        console.print(f"[bold green]Argus Sentinel node {node_id}[/bold green]: {workers} workers, API {api_url} [dim](Ctrl+C to stop)[/dim]")
+        HeadlessNode(api_url, node_id, model_pool, proof_sink,
+                     resolve_model=lambda model_name: resolve_model_path(model_name, model_dir, default_model),
+                     constraints=NODE_CONSTRAINTS, workers=workers, lease_seconds=lease_seconds, interval=interval,
+                     push=push, report_interval=report_interval, log=console.print, status=node_status).run()
+        if uploader:
+            uploader.stop()
+        return
+
     console.clear()
     console.print(Panel.fit("[bold green]ARGUS SENTINEL NODE[/bold green]\n[dim]Autonomous Verification Agent v1.0[/dim]"))
     
-    runtime = SecureRuntime("/home/wethinkcode/Argus/privacy_model.bin") # Default model
-    
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -153,21 +219,40 @@ def start_node(
         transient=False,
     ) as progress:
         task = progress.add_task(description="Syncing with SilverLock Network...", total=None)
+        # Push mode: queue position taken before each lease, so a request created in between still wakes us
+        queue_seq = None
         
         while True:
             try:
-                # 1. Fetch Queue
+                # 1. Lease the oldest pending job (atomic, so no other node gets it too)
                 try:
-                    res = requests.get(f"{api_url}/api/queue")
-                    queue = res.json()
+                    if push and queue_seq is None:
+                        queue_seq = requests.get(f"{api_url}/api/events/queue/poll", params={"timeout": 0}).json()["seq"]
+                    res = requests.post(f"{api_url}/api/lease", json={"node_id": node_id, "limit": 1, "lease_seconds": lease_seconds})
+                    lease = res.json()
+                    queue = lease["requests"]
                 except Exception:
                     progress.update(task, description="[red]Connection Lost. Retrying...[/red]")
                     time.sleep(interval)
                     continue
                 
                 if not queue:
-                    progress.update(task, description=f"[dim]Node Idle - Listening for requests... ({time.strftime('%H:%M:%S')})[/dim]")
-                    time.sleep(interval)
+                    pool_stats = model_pool.stats()
+                    upload_status = ""
+                    if uploader:
+                        upload_stats = uploader.stats()
+                        upload_status = f" | upload backlog: {upload_stats['backlog']} oldest: {upload_stats['oldest_pending_s']}s"
+                    progress.update(task, description=f"[dim]Node Idle - Listening for requests... ({time.strftime('%H:%M:%S')}) | models warm: {pool_stats['loaded']} hits: {pool_stats['hits']} misses: {pool_stats['misses']} evictions: {pool_stats['evictions']}{upload_status}[/dim]")
+                    if push:
+                        # Returns as soon as a request is created (or a lease is released)
+                        try:
+                            res = requests.get(f"{api_url}/api/events/queue/poll", params={"since": queue_seq, "timeout": 25}, timeout=35)
+                            queue_seq = res.json()["seq"]
+                        except Exception:
+                            queue_seq = None
+                            time.sleep(interval)
+                    else:
+                        time.sleep(interval)
                     continue
                 
                 # 2. Process Job
@@ -178,24 +263,29 @@ def start_node(
                 cinematic_print(f" >> Initializing Execution Environment...")
                 
                 # Execute
-                constraints = {
-                    "max_input_length": 2048,
-                    "privacy": {  # Enable Privacy/ZKP by default for the demo node
-                        "min_score": 700,
-                        "min_income": 40000,
-                        "age_limit": 18
-                    }
-                }
                 input_data = job['input_context']
                 
                 # Pass metadata (model_name) to be included in the signed trace
-                proof_data = runtime.execute(input_data, constraints, metadata={"model_name": job['model_name']})
+                model_path = resolve_model_path(job['model_name'], model_dir, default_model)
+                with model_pool.acquire(model_path) as runtime:
+                    proof_data = runtime.execute(input_data, NODE_CONSTRAINTS, metadata={"model_name": job['model_name']})
                 
                 try:
-                    storage = IPFSStorage()
-                    cid = storage.save_proof(proof_data)
+                    cid = proof_sink.save_proof(proof_data)
                     
-                    # Broadcast to feed (MUST include CID)
+                    # 3. Complete Request (rejected if our lease expired and another node took the job)
+                    payload = {
+                        "req_uuid": job['req_uuid'],
+                        "proof_cid": cid,
+                        "status": "VERIFIED",
+                        "lease_id": lease["lease_id"]
+                    }
+                    res = requests.post(f"{api_url}/api/complete", json=payload)
+                    if res.status_code == 409:
+                        cinematic_print(f" >> [yellow]Lease lost: job {job['req_uuid'][:8]} was reassigned, result discarded[/yellow]\n")
+                        continue
+                    
+                    # 4. Broadcast to feed (MUST include CID)
                     broadcast_payload = {
                         "cid": cid,
                         "type": "execution_proof",
@@ -203,14 +293,6 @@ def start_node(
                     }
                     requests.post(f"{api_url}/api/broadcast", json=broadcast_payload)
                     
-                    # 4. Complete Request
-                    payload = {
-                        "req_uuid": job['req_uuid'],
-                        "proof_cid": cid,
-                        "status": "VERIFIED"
-                    }
-                    requests.post(f"{api_url}/api/complete", json=payload)
-                    
                     cinematic_print(f" >> [green]✓ PROOF GENERATED & BROADCAST[/green]")
                     cinematic_print(f" >> CID: {cid}\n")
                     
@@ -219,6 +301,8 @@ def start_node(
                 
             except KeyboardInterrupt:
                 console.print("\n[yellow]Shutting down Sentinel Node...[/yellow]")
+                if uploader:
+                    uploader.stop()
                 break
             except Exception as e:
                 console.print(f"[red]Critical Error: {e}[/red]")
@@ -229,11 +313,13 @@ def verify(cid: str = typer.Argument(..., help="IPFS CID or Path to proof JSON")
     """
     Verify an execution proof from IPFS or local file.
     """
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+    from sentinel.core.proof import ProofGenerator
+
     proof = None
     
-    # Try fetching from IPFS first
-    storage = IPFSStorage()
-    
     with Progress(SpinnerColumn(), TextColumn("[progress.description]Fetching Proof..."), transient=True) as p:
         p.add_task("fetch")
         # Check if it looks like a file path
@@ -241,7 +327,9 @@ def verify(cid: str = typer.Argument(..., help="IPFS CID or Path to proof JSON")
              with open(cid, 'r') as f:
                  proof = json.load(f)
         else:
-            proof = storage.get_proof(cid)
+            # Not a file: fetch from IPFS (the HTTP client is only loaded for this case)
+            from sentinel.storage.ipfs import IPFSStorage
+            proof = IPFSStorage().get_proof(cid)
 
     if not proof:
         console.print(f"[bold red]Error:[/bold red] Could not retrieve proof for CID/Path: {cid}")
@@ -257,13 +345,83 @@ def verify(cid: str = typer.Argument(..., help="IPFS CID or Path to proof JSON")
     table.add_column("Status", style="bold")
     
     if is_valid:
-        table.add_row("Integrity Check (Hash Match)", "[green]PASS[/green]")
+        table.add_row("Integrity & Signature Check", "[green]PASS[/green]")
         console.print(table)
         console.print(Panel("[bold green]VERIFICATION SUCCESSFUL[/bold green]\nThe execution trace is authentic and has not been tampered with.", border_style="green"))
     else:
-        table.add_row("Integrity Check (Hash Match)", "[red]FAIL[/red]")
+        table.add_row("Integrity & Signature Check", "[red]FAIL[/red]")
         console.print(table)
         console.print(Panel("[bold red]VERIFICATION FAILED[/bold red]\nThe proof signature does not match the content. Data may have been tampered with.", border_style="red"))
 
+@app.command()
+def migrate_storage(root: str = typer.Option("sentinel_storage", help="Local proof store to migrate")):
+    """
+    Moves proofs from the legacy flat mock store into the sharded, indexed layout.
+    """
+    from sentinel.storage.local import LocalProofStore
+
+    store = LocalProofStore(root)
+    migrated = store.migrate_flat()
+    console.print(f"[bold green]Migrated {migrated} proofs[/bold green] into {root} ({store.count()} indexed)")
+
+@app.command()
+def pack_storage(
+    root: str = typer.Option("sentinel_storage", help="Local proof store to read from"),
+    pack_root: str = typer.Option("sentinel_packs", help="Packfile store to write to"),
+    dictionary_samples: int = typer.Option(16, help="Proofs used to build the shared compression dictionary (0 disables it)"),
+    compact: bool = typer.Option(True, help="Merge sealed segments after packing")
+):
+    """
+    Copies proofs from the one-file-per-proof store into compressed packfiles.
+    """
+    from sentinel.storage.local import LocalProofStore
+    from sentinel.storage.packfile import PackfileProofStore, build_dictionary
+
+    store = LocalProofStore(root)
+    rows = []
+    after = None
+    while True:
+        page = store.list(after=after, limit=1000)
+        if not page:
+            break
+        rows.extend(page)
+        after = (page[-1]["created_at"], page[-1]["cid"])
+
+    dictionary = None
+    if dictionary_samples and not (Path(pack_root) / "zdict.bin").exists():
+        dictionary = build_dictionary(store.get(row["cid"]) for row in rows[-dictionary_samples:]) or None
+    packs = PackfileProofStore(pack_root, dictionary=dictionary)
+    for row in rows:
+        content = store.get(row["cid"])
+        if content is not None:
+            packs.put(row["cid"], content)
+    if compact:
+        packs.compact()
+    console.print(f"[bold green]Packed {packs.count()} proofs[/bold green] into {pack_root} ({packs.disk_bytes() / 1024:.1f} KiB on disk)")
+    packs.close()
+
+@app.command()
+def ipfs_standin(
+    port: int = typer.Option(5001, help="Port to serve the IPFS API on"),
+    latency_ms: float = typer.Option(0.0, help="Latency added to every request"),
+    jitter_ms: float = typer.Option(0.0, help="Uniform random latency on top of --latency-ms"),
+    failure_rate: float = typer.Option(0.0, help="Fraction of add/cat requests answered with HTTP 500"),
+    throughput_kbps: Optional[float] = typer.Option(None, help="Shared transfer cap in KiB/s")
+):
+    """
+    Serves a local in-memory IPFS API stand-in for offline demos and benchmarks.
+    """
+    from sentinel.storage.standin import LocalIPFSNode
+
+    node = LocalIPFSNode(port=port, latency=latency_ms / 1000, jitter=jitter_ms / 1000, failure_rate=failure_rate,
+                         throughput_bytes_per_s=throughput_kbps * 1024 if throughput_kbps else None).start()
+    console.print(f"[bold green]IPFS stand-in listening on {node.url}[/bold green] [dim](Ctrl+C to stop)[/dim]")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        node.stop()
+        console.print(f"[yellow]Stopped.[/yellow] {len(node.blocks)} blocks, requests: {node.requests}")
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+class ResultCache:
+    """
+    Opt-in memoization of deterministic model outputs, keyed by
+    (model_hash, input_hash, constraints fingerprint).
+    An in-memory LRU sits in front of an optional on-disk SQLite tier; both honour the TTL.
+    """
+    def __init__(self, max_entries: int = 10000, ttl_seconds: Optional[float] = 3600,
+                 disk_path: Optional[Union[str, Path]] = None, disk_max_entries: int = 1_000_000):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_max_entries = disk_max_entries
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+        if disk_path:
+            self._disk = sqlite3.connect(str(disk_path), check_same_thread=False)
+            self._disk.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, output TEXT, model_ms REAL, cached_at REAL, last_used REAL)")
+            self._disk.execute("CREATE INDEX IF NOT EXISTS ix_results_last_used ON results (last_used)")
+            self._disk.commit()
+
+        self._puts_since_prune = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.saved_ms = 0.0
+
+    @staticmethod
+    def make_key(model_hash: str, input_hash: str, constraints: Dict[str, Any]) -> str:
+        fingerprint = hashlib.sha256(json.dumps(constraints, sort_keys=True).encode('utf-8')).hexdigest()
+        return hashlib.sha256(f"{model_hash}:{input_hash}:{fingerprint}".encode('utf-8')).hexdigest()
+
+    def _expired(self, cached_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - cached_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns {"output", "model_ms", "cached_at"} for a live entry, or None.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and self._expired(entry["cached_at"], now):
+                del self._memory[key]
+                entry = None
+            if entry:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.saved_ms += entry["model_ms"]
+                return entry
+
+            if self._disk:
+                row = self._disk.execute("SELECT output, model_ms, cached_at FROM results WHERE key = ?", (key,)).fetchone()
+                if row and not self._expired(row[2], now):
+                    entry = {"output": row[0], "model_ms": row[1], "cached_at": row[2]}
+                    self._disk.execute("UPDATE results SET last_used = ? WHERE key = ?", (now, key))
+                    self._disk.commit()
+                    self._remember(key, entry)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    self.saved_ms += entry["model_ms"]
+                    return entry
+                if row:
+                    self._disk.execute("DELETE FROM results WHERE key = ?", (key,))
+                    self._disk.commit()
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, output: str, model_ms: float):
+        now = time.time()
+        entry = {"output": output, "model_ms": model_ms, "cached_at": now}
+        with self._lock:
+            self._remember(key, entry)
+            if self._disk:
+                self._disk.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)", (key, output, model_ms, now, now))
+                # Counting is a table scan, so the size limit is enforced in periodic sweeps
+                self._puts_since_prune += 1
+                if self._puts_since_prune >= 256:
+                    self._puts_since_prune = 0
+                    count = self._disk.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+                    if count > self.disk_max_entries:
+                        self._disk.execute("DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used LIMIT ?)", (count - self.disk_max_entries,))
+                self._disk.commit()
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        # Caller holds self._lock
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "saved_ms": round(self.saved_ms, 1),
+                "memory_entries": len(self._memory),
+            }
+
+    def close(self):
+        if self._disk:
+            self._disk.close()
+            self._disk = None
@@ -1,6 +1,14 @@
-from typing import Dict, Any, List
+import json
+import operator
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Union
 from pydantic import BaseModel
 
+try:
+    import numpy as np  # Optional: vectorizes PrivacyEngine batch evaluation
+except ImportError:
+    np = None
+
 class ConstraintConfig(BaseModel):
     allowed_model_hashes: List[str] = []
     max_input_length: int = 1000
@@ -22,48 +30,220 @@ class ConstraintEngine:
         # Post-execution validation rules
         pass
 
-class PrivacyEngine:
+REDACTED_VALUE = "REDACTED_ZKP_VERIFIED"
+
+# Comparison operators allowed in privacy rules, with their negation for failure messages
+PRIVACY_OPERATORS = {
+    ">=": (operator.ge, "<"),
+    ">": (operator.gt, "<="),
+    "<=": (operator.le, ">"),
+    "<": (operator.lt, ">="),
+    "==": (operator.eq, "!="),
+    "!=": (operator.ne, "=="),
+}
+
+class PrivacyRule(BaseModel):
     """
-    Simulates Zero-Knowledge Proofs for privacy-preserving attribute verification.
+    A declarative predicate over one input field, e.g. {"field": "score", "op": ">=", "value": 700}.
     """
-    @staticmethod
-    def apply_privacy_rules(input_data: str, privacy_rules: Dict[str, Any]) -> tuple[str, List[str]]:
+    field: str
+    op: str = ">="
+    value: Any
+    label: Optional[str] = None  # Name used in the ZKP statement, defaults to the capitalized field
+    redact: bool = True  # Replace the raw value once the predicate is proven
+    report_failure: bool = True  # Emit a "check FAILED" statement when the predicate does not hold
+
+# Shorthand keys supported since the first release, in the order they have always been evaluated
+LEGACY_PRIVACY_RULES = [
+    ("min_score", "score", "Score", True),
+    ("min_income", "income", "Income", False),
+    ("age_limit", "age", "Age", False),
+]
+
+class CompiledPrivacyRules:
+    """
+    A privacy rule set compiled once into a flat evaluator.
+    """
+    def __init__(self, rules: List[PrivacyRule]):
+        self.rules = []
+        for rule in rules:
+            if rule.op not in PRIVACY_OPERATORS:
+                raise ValueError(f"Unsupported privacy operator '{rule.op}' for field '{rule.field}'")
+            compare, negated = PRIVACY_OPERATORS[rule.op]
+            label = rule.label or rule.field.capitalize()
+            passed = f"ZKP: {label} {rule.op} {rule.value} Verified"
+            failed = f"ZKP: {label} check FAILED (Value {negated} {rule.value})" if rule.report_failure else None
+            self.rules.append((rule.field, rule.op, compare, rule.value, passed, failed, rule.redact))
+
+    def evaluate(self, data: Dict[str, Any]) -> tuple[Dict[str, Any], List[str]]:
+        """
+        Checks every rule against a parsed record and redacts proven fields in place.
+        """
+        proofs = []
+        redact = []
+        # Predicates always see the original values, so redaction happens after all checks
+        for field, _, compare, threshold, passed, failed, redacts in self.rules:
+            if field not in data:
+                continue
+            if compare(data[field], threshold):
+                proofs.append(passed)
+                if redacts:
+                    redact.append(field)
+            elif failed:
+                proofs.append(failed)
+
+        for field in redact:
+            data[field] = REDACTED_VALUE
+        return data, proofs
+
+    def apply(self, input_data: str) -> tuple[str, List[str]]:
         """
         Parses input, checks rules, and returns (redacted_input, proof_of_checks).
         """
-        import json
         try:
             data = json.loads(input_data)
         except json.JSONDecodeError:
             return input_data, []  # Not JSON, cannot apply structured privacy rules
 
-        redacted_data = data.copy()
-        proofs = []
+        if not isinstance(data, dict):
+            return json.dumps(data, sort_keys=True), []
 
-        # Example Rule: "min_score": 700 checks if data['score'] >= 700
-        if "min_score" in privacy_rules and "score" in data:
-            threshold = privacy_rules["min_score"]
-            actual = data["score"]
-            if actual >= threshold:
-                proofs.append(f"ZKP: Score >= {threshold} Verified")
-                # REDACT the actual score
-                redacted_data["score"] = "REDACTED_ZKP_VERIFIED"
+        # The parsed dict is private to this call, so it is redacted without copying
+        redacted_data, proofs = self.evaluate(data)
+        return json.dumps(redacted_data, sort_keys=True), proofs
+
+    def apply_batch(self, records: List[Union[str, Dict[str, Any]]], return_exceptions: bool = False) -> List[Any]:
+        """
+        Applies the rule set to many records at once, column by column.
+        Each predicate is evaluated over the whole column with a single vectorized
+        comparison when NumPy is available. Output matches apply() record for record;
+        with return_exceptions=True a failing record yields its exception instead.
+        """
+        results: List[Any] = [None] * len(records)
+        parsed = []  # (position, dict)
+        for pos, record in enumerate(records):
+            if isinstance(record, dict):
+                parsed.append((pos, dict(record)))
+                continue
+            try:
+                data = json.loads(record)
+            except json.JSONDecodeError:
+                results[pos] = (record, [])
+                continue
+            if isinstance(data, dict):
+                parsed.append((pos, data))
             else:
-                proofs.append(f"ZKP: Score check FAILED (Value < {threshold})")
-
-        # Example Rule: "min_income"
-        if "min_income" in privacy_rules and "income" in data:
-             threshold = privacy_rules["min_income"]
-             actual = data["income"]
-             if actual >= threshold:
-                 proofs.append(f"ZKP: Income >= {threshold} Verified")
-                 redacted_data["income"] = "REDACTED_ZKP_VERIFIED"
-        
-        # Example Rule: "age_limit"
-        if "age_limit" in privacy_rules and "age" in data:
-            limit = privacy_rules["age_limit"]
-            if data["age"] >= limit:
-                proofs.append(f"ZKP: Age >= {limit} Verified")
-                redacted_data["age"] = "REDACTED_ZKP_VERIFIED"
+                results[pos] = (json.dumps(data, sort_keys=True), [])
 
-        return json.dumps(redacted_data, sort_keys=True), proofs
+        proofs = [[] for _ in parsed]
+        redact = [[] for _ in parsed]
+        errors: Dict[int, Exception] = {}
+
+        for field, op, compare, threshold, passed, failed, redacts in self.rules:
+            rows = [i for i, (_, data) in enumerate(parsed) if field in data]
+            if not rows:
+                continue
+            column = [parsed[i][1][field] for i in rows]
+            mask = self._compare_column(column, op, compare, threshold, rows, errors)
+            for i, ok in zip(rows, mask):
+                if i in errors:
+                    continue
+                if ok:
+                    proofs[i].append(passed)
+                    if redacts:
+                        redact[i].append(field)
+                elif failed:
+                    proofs[i].append(failed)
+
+        for i, (pos, data) in enumerate(parsed):
+            if i in errors:
+                if not return_exceptions:
+                    raise errors[i]
+                results[pos] = errors[i]
+                continue
+            for field in redact[i]:
+                data[field] = REDACTED_VALUE
+            results[pos] = (json.dumps(data, sort_keys=True), proofs[i])
+        return results
+
+    @staticmethod
+    def _compare_column(column: List[Any], op: str, compare, threshold: Any, rows: List[int], errors: Dict[int, Exception]) -> List[bool]:
+        if np is not None and _vectorizes_exactly(column, threshold):
+            return compare(np.asarray(column), threshold).tolist()
+
+        mask = []
+        for i, value in zip(rows, column):
+            try:
+                mask.append(compare(value, threshold))
+            except Exception as e:
+                errors[i] = e
+                mask.append(False)
+        return mask
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+def _is_int64(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and _INT64_MIN <= value <= _INT64_MAX
+
+def _vectorizes_exactly(column: List[Any], threshold: Any) -> bool:
+    """
+    True only if a NumPy comparison gives exactly Python's answer for every value.
+    Python compares ints and floats exactly; float64 rounds ints above 2**53, so an
+    int column mixed with floats (or compared to a float) must stay on the Python path.
+    """
+    if _is_int64(threshold) and all(_is_int64(v) for v in column):
+        return True  # int64 array against an int64 threshold
+    if all(isinstance(v, float) for v in column):
+        # float64 array: the threshold must convert to float64 exactly too
+        return isinstance(threshold, float) or (_is_int64(threshold) and abs(threshold) <= 2 ** 53)
+    return False
+
+@lru_cache(maxsize=128)
+def _compile_cached(rules_json: str) -> CompiledPrivacyRules:
+    return PrivacyEngine.compile_rules(json.loads(rules_json))
+
+class PrivacyEngine:
+    """
+    Simulates Zero-Knowledge Proofs for privacy-preserving attribute verification.
+    """
+    @staticmethod
+    def compile_rules(privacy_rules: Dict[str, Any]) -> CompiledPrivacyRules:
+        """
+        Compiles a privacy rule set. Accepts the legacy shorthand keys
+        (min_score, min_income, age_limit) and/or a "rules" list of PrivacyRule dicts.
+        """
+        rules = []
+        for key, field, label, report_failure in LEGACY_PRIVACY_RULES:
+            if key in privacy_rules:
+                rules.append(PrivacyRule(field=field, op=">=", value=privacy_rules[key], label=label, report_failure=report_failure))
+        for rule in privacy_rules.get("rules", []):
+            rules.append(rule if isinstance(rule, PrivacyRule) else PrivacyRule(**rule))
+        return CompiledPrivacyRules(rules)
+
+    @staticmethod
+    def compile(privacy_rules: Dict[str, Any]) -> CompiledPrivacyRules:
+        """
+        Returns the compiled evaluator for a rule set, reusing it across calls with the same rules.
+        """
+        try:
+            key = json.dumps(privacy_rules, sort_keys=True)
+        except TypeError:
+            return PrivacyEngine.compile_rules(privacy_rules)  # Rules holding PrivacyRule objects are not cacheable
+        return _compile_cached(key)
+
+    @staticmethod
+    def apply_privacy_rules(input_data: str, privacy_rules: Dict[str, Any]) -> tuple[str, List[str]]:
+        """
+        Parses input, checks rules, and returns (redacted_input, proof_of_checks).
+        """
+        return PrivacyEngine.compile(privacy_rules).apply(input_data)
+
+    @staticmethod
+    def apply_privacy_rules_batch(records: List[Union[str, Dict[str, Any]]], privacy_rules: Dict[str, Any], return_exceptions: bool = False) -> List[Any]:
+        """
+        Columnar variant of apply_privacy_rules for thousands of records at once.
+        """
+        return PrivacyEngine.compile(privacy_rules).apply_batch(records, return_exceptions)
@@ -0,0 +1,114 @@
+import json
+import secrets
+from typing import Dict, Any
+
+# Unpredictable per process, so no user-supplied string can collide with the placeholder
+_PLACEHOLDER = f"argus-trace-{secrets.token_hex(16)}"
+
+def splice_trace_json(credential: Dict[str, Any], trace_json: str, include_proof: bool = True) -> str:
+    """
+    Same output as json.dumps(credential, sort_keys=True), but the execution trace is
+    spliced in from its existing canonical form instead of being re-serialized.
+    The small credential envelope is still encoded by the C encoder.
+    """
+    skeleton = {k: v for k, v in credential.items() if include_proof or k != "proof"}
+    skeleton["credentialSubject"] = {**credential["credentialSubject"], "executionTrace": _PLACEHOLDER}
+    return json.dumps(skeleton, sort_keys=True).replace(f'"{_PLACEHOLDER}"', trace_json, 1)
+
+class Credential(dict):
+    """
+    A Verifiable Credential that computes its canonical serializations lazily, at most once.
+    The execution trace is serialized a single time when the credential is built and that
+    fragment is reused for the trace hash, the signature, storage and CID derivation.
+
+    Treat an issued Credential as immutable: top-level assignments reset the cache,
+    but edits inside nested objects are not tracked. Use to_dict() for a mutable copy.
+    """
+    __slots__ = ("_trace_json", "_unsigned", "_canonical")
+
+    def __init__(self, *args, trace_json: str = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._trace_json = trace_json
+        self._unsigned = None
+        self._canonical = None
+
+    def _serialize(self, include_proof: bool) -> bytes:
+        if self._trace_json is None or not isinstance(self.get("credentialSubject"), dict):
+            body = {k: v for k, v in self.items() if include_proof or k != "proof"}
+            return json.dumps(body, sort_keys=True).encode("utf-8")
+        return splice_trace_json(self, self._trace_json, include_proof).encode("utf-8")
+
+    def unsigned_bytes(self) -> bytes:
+        """
+        Canonical bytes of the credential without its proof block (what gets signed).
+        """
+        if self._unsigned is None:
+            self._unsigned = self._serialize(include_proof=False)
+        return self._unsigned
+
+    def canonical_bytes(self) -> bytes:
+        """
+        Canonical bytes of the full credential (what gets stored and content-addressed).
+        """
+        if self._canonical is None:
+            self._canonical = self._serialize(include_proof=True)
+        return self._canonical
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a plain, deep, mutable copy of the credential.
+        """
+        return json.loads(self.canonical_bytes())
+
+    def _invalidate(self, key: Any = None):
+        self._canonical = None
+        if key != "proof":
+            self._unsigned = None
+            if key in (None, "credentialSubject"):
+                self._trace_json = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._invalidate(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._invalidate(key)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._invalidate()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._invalidate(args[0])
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._invalidate()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._invalidate(key)
+        return value
+
+    def clear(self):
+        super().clear()
+        self._invalidate()
+
+    def __reduce__(self):
+        # Pickle as a plain dict payload plus the cached trace fragment
+        return (_rebuild_credential, (dict(self), self._trace_json))
+
+def _rebuild_credential(data: Dict[str, Any], trace_json: str) -> Credential:
+    return Credential(data, trace_json=trace_json)
+
+def canonical_bytes(obj: Dict[str, Any]) -> bytes:
+    """
+    Canonical JSON bytes for any proof, reusing the cached form of a Credential.
+    """
+    if isinstance(obj, Credential):
+        return obj.canonical_bytes()
+    return json.dumps(obj, sort_keys=True).encode("utf-8")
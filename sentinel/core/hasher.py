@@ -1,6 +1,17 @@
 import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Union
+from typing import Union, Optional, Dict, Any, List, Iterable
+from .merkle import hash_leaf, merkle_root
+
+# 4 MiB leaves keep per-leaf overhead negligible while giving plenty of parallelism
+DEFAULT_LEAF_SIZE = 4 * 1024 * 1024
 
 class ModelHasher:
     @staticmethod
@@ -25,3 +36,164 @@ class ModelHasher:
         Generates a SHA-256 hash of a string input.
         """
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def merkle_leaves(file_path: Union[str, Path], leaf_size: int = DEFAULT_LEAF_SIZE, workers: Optional[int] = None, indices: Optional[Iterable[int]] = None) -> List[bytes]:
+        """
+        Memory-maps the file and hashes its fixed-size leaves in parallel.
+        hashlib releases the GIL on large buffers, so threads scale across cores.
+        If indices is given, only those leaves are hashed (in the order given).
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Model file not found: {path}")
+
+        size = path.stat().st_size
+        if size == 0:
+            return [hash_leaf(b"")]
+
+        leaf_count = (size + leaf_size - 1) // leaf_size
+        targets = list(range(leaf_count)) if indices is None else list(indices)
+        for i in targets:
+            if not 0 <= i < leaf_count:
+                raise IndexError(f"Leaf {i} is out of range for a file of {leaf_count} leaves")
+
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                def hash_one(i: int) -> bytes:
+                    return hash_leaf(view[i * leaf_size:(i + 1) * leaf_size])
+
+                with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+                    return list(pool.map(hash_one, targets))
+            finally:
+                # The mmap cannot close while a view into it is still alive
+                view.release()
+
+    @staticmethod
+    def merkle_root(file_path: Union[str, Path], leaf_size: int = DEFAULT_LEAF_SIZE, workers: Optional[int] = None) -> str:
+        """
+        Generates the Merkle root of a file hashed as fixed-size leaves.
+        """
+        return merkle_root(ModelHasher.merkle_leaves(file_path, leaf_size, workers)).hex()
+
+    @staticmethod
+    def rehash_leaves(file_path: Union[str, Path], leaves: List[bytes], changed: Iterable[int], leaf_size: int = DEFAULT_LEAF_SIZE, workers: Optional[int] = None) -> List[bytes]:
+        """
+        Updates a previously computed leaf list after a partial rewrite of the file.
+        Only the changed leaves are re-read; if the file grew or shrank, the tail
+        leaves affected by the new length are rehashed as well.
+        """
+        size = Path(file_path).stat().st_size
+        leaf_count = max(1, (size + leaf_size - 1) // leaf_size)
+
+        updated = list(leaves[:leaf_count])
+        dirty = {i for i in changed if i < leaf_count}
+        if leaf_count != len(leaves):
+            # The old last leaf may have been partial, so it changes along with any new ones
+            dirty.update(range(min(len(leaves), leaf_count) - 1, leaf_count))
+            updated.extend([b""] * (leaf_count - len(updated)))
+        dirty.discard(-1)
+
+        order = sorted(dirty)
+        for i, digest in zip(order, ModelHasher.merkle_leaves(file_path, leaf_size, workers, indices=order)):
+            updated[i] = digest
+        return updated
+
+class ModelHashIndex:
+    """
+    Persistent sidecar index of model file hashes.
+    Entries are keyed by resolved path and only trusted while the file's
+    size, mtime, ctime and inode are unchanged; anything else forces a full rehash.
+    """
+    # Files modified this recently may still be changing within the same mtime tick
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, index_path: Union[str, Path] = "sentinel_hash_index.json"):
+        self.index_path = Path(index_path)
+        self._entries = self._load()
+        # Threads sharing the index (e.g. a ModelPool under a multi-worker node) update it one at a time
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, "r") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self):
+        # Atomic replace so a crash never leaves a half-written index behind.
+        # A unique temp file per writer: concurrent saves (threads or processes) never share one.
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{self.index_path.name}.", suffix=".tmp", dir=self.index_path.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._entries, f, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def _fingerprint(st: os.stat_result) -> Dict[str, int]:
+        return {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "ctime_ns": st.st_ctime_ns,
+            "inode": st.st_ino,
+        }
+
+    def lookup(self, file_path: Union[str, Path], key: str = "sha256") -> Optional[str]:
+        """
+        Returns the cached digest if the file is unchanged since it was indexed.
+        """
+        path = Path(file_path).resolve()
+        entry = self._entries.get(str(path))
+        if not entry:
+            return None
+        try:
+            fingerprint = self._fingerprint(path.stat())
+        except FileNotFoundError:
+            return None
+        if any(entry.get(k) != v for k, v in fingerprint.items()):
+            return None
+        return entry.get(key)
+
+    def hash_file(self, file_path: Union[str, Path]) -> str:
+        """
+        Returns the SHA-256 of the file, rehashing only when the index entry is stale.
+        """
+        return self._cached(file_path, "sha256", ModelHasher.hash_file)
+
+    def merkle_root(self, file_path: Union[str, Path], leaf_size: int = DEFAULT_LEAF_SIZE, workers: Optional[int] = None) -> str:
+        """
+        Returns the Merkle root of the file, rehashing only when the index entry is stale.
+        """
+        return self._cached(file_path, f"merkle:{leaf_size}", lambda p: ModelHasher.merkle_root(p, leaf_size, workers))
+
+    def _cached(self, file_path: Union[str, Path], key: str, compute) -> str:
+        cached = self.lookup(file_path, key)
+        if cached:
+            return cached
+
+        path = Path(file_path).resolve()
+        before = path.stat() if path.exists() else None
+        digest = compute(path)
+        after = path.stat()
+
+        # Only record hashes of files that were stable while we read them
+        fingerprint = self._fingerprint(after)
+        if before and self._fingerprint(before) == fingerprint and time.time_ns() - after.st_mtime_ns > self.RACY_WINDOW_NS:
+            with self._lock:
+                self._entries = self._load()
+                entry = self._entries.get(str(path), {})
+                if any(entry.get(k) != v for k, v in fingerprint.items()):
+                    entry = {}  # Stale digests from an older version of the file must not survive
+                self._entries[str(path)] = {**entry, **fingerprint, key: digest}
+                try:
+                    self._save()
+                except OSError:
+                    pass # Read-only location: fall back to hashing every time
+
+        return digest
@@ -1,10 +1,44 @@
 import base64
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Tuple
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ed25519
 
+# Multicodec prefix for Ed25519 public keys
+ED25519_MULTICODEC = b"\xed\x01"
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+def _base58_decode(value: str) -> bytes:
+    number = 0
+    for char in value:
+        number = number * 58 + BASE58_ALPHABET.index(char)
+    raw = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    leading_zeros = len(value) - len(value.lstrip("1"))
+    return b"\x00" * leading_zeros + raw
+
+@lru_cache(maxsize=1024)
+def resolve_did_key(did: str) -> ed25519.Ed25519PublicKey:
+    """
+    Resolves a did:key identifier to its Ed25519 public key.
+    Accepts the hex fingerprint issued by DIDManager as well as standard
+    multibase base58btc did:key values. Parsed keys are cached per DID.
+    """
+    if not did.startswith("did:key:z"):
+        raise ValueError(f"Unsupported DID method: {did}")
+    fingerprint = did[len("did:key:z"):].split("#")[0]
+
+    if len(fingerprint) == 64 and all(c in "0123456789abcdef" for c in fingerprint):
+        pub_bytes = bytes.fromhex(fingerprint)
+    else:
+        decoded = _base58_decode(fingerprint)
+        if not decoded.startswith(ED25519_MULTICODEC):
+            raise ValueError(f"did:key is not an Ed25519 key: {did}")
+        pub_bytes = decoded[len(ED25519_MULTICODEC):]
+
+    return ed25519.Ed25519PublicKey.from_public_bytes(pub_bytes)
+
 class DIDManager:
     def __init__(self, key_path: str = "sentinel_key.pem"):
         self.key_path = Path(key_path)
@@ -56,5 +90,11 @@ class DIDManager:
         signature = self.private_key.sign(message)
         return signature.hex()
 
+    def sign_bytes(self, message: bytes) -> str:
+        """
+        Signs raw bytes (e.g. a Merkle root) and returns the signature as a hex string.
+        """
+        return self.private_key.sign(message).hex()
+
     def get_verification_method(self) -> str:
         return f"{self.did}#keys-1"
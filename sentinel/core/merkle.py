@@ -0,0 +1,71 @@
+import hashlib
+from typing import List, Tuple, Union
+
+# Domain separation prefixes (RFC 6962 style) so a leaf can never be passed off as an inner node
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+def hash_leaf(data: Union[bytes, memoryview]) -> bytes:
+    """
+    Hashes a leaf payload into a Merkle leaf node.
+    Hashed incrementally so a memoryview leaf (e.g. a slice of an mmap) is never copied.
+    """
+    h = hashlib.sha256(LEAF_PREFIX)
+    h.update(data)
+    return h.digest()
+
+def hash_node(left: bytes, right: bytes) -> bytes:
+    """
+    Combines two child hashes into their parent node.
+    """
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+def merkle_levels(leaf_hashes: List[bytes]) -> List[List[bytes]]:
+    """
+    Builds every level of the tree, from the leaves up to the root.
+    An odd node at the end of a level is promoted unchanged rather than duplicated.
+    """
+    if not leaf_hashes:
+        raise ValueError("Cannot build a Merkle tree without leaves")
+
+    levels = [list(leaf_hashes)]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = [hash_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        levels.append(parents)
+    return levels
+
+def merkle_root(leaf_hashes: List[bytes]) -> bytes:
+    """
+    Returns the root hash over the given leaf hashes.
+    """
+    return merkle_levels(leaf_hashes)[-1][0]
+
+def merkle_path(levels: List[List[bytes]], index: int) -> List[Tuple[str, bytes]]:
+    """
+    Returns the inclusion path for a leaf as (position, sibling_hash) pairs, leaf to root.
+    Position says on which side the sibling sits; levels where the node was promoted are skipped.
+    """
+    path = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            path.append(("left" if sibling < index else "right", level[sibling]))
+        index //= 2
+    return path
+
+def root_from_path(leaf_hash: bytes, path: List[Tuple[str, bytes]]) -> bytes:
+    """
+    Folds an inclusion path back up to the root it commits to.
+    """
+    node = leaf_hash
+    for position, sibling in path:
+        if position == "left":
+            node = hash_node(sibling, node)
+        elif position == "right":
+            node = hash_node(node, sibling)
+        else:
+            raise ValueError(f"Invalid Merkle path position: {position}")
+    return node
@@ -0,0 +1,129 @@
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Union
+from .backends import ModelBackend, SimulatedBackend
+from .hasher import ModelHashIndex
+from .runtime import SecureRuntime
+
+class _PoolEntry:
+    __slots__ = ("runtime", "size", "refs")
+
+    def __init__(self, runtime: SecureRuntime, size: int):
+        self.runtime = runtime
+        self.size = size
+        self.refs = 0
+
+class ModelPool:
+    """
+    Keeps loaded models warm, keyed by model hash, and evicts the least recently
+    used ones once the configured memory budget is exceeded.
+    Models that are currently acquired are never evicted.
+    """
+    def __init__(self, memory_budget_bytes: int = 4 * 1024 ** 3,
+                 backend_factory: Optional[Callable[[Path, str], ModelBackend]] = None,
+                 hash_index: Optional[ModelHashIndex] = None):
+        self.memory_budget_bytes = memory_budget_bytes
+        self.backend_factory = backend_factory if backend_factory else lambda path, model_hash: SimulatedBackend(model_hash, model_path=path)
+        self.hash_index = hash_index if hash_index else ModelHashIndex()
+
+        self._entries: "OrderedDict[str, _PoolEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: Dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @contextmanager
+    def acquire(self, model_path: Union[str, Path]) -> Iterator[SecureRuntime]:
+        """
+        Yields a warm SecureRuntime for the model, loading it on a miss.
+        """
+        entry = self._checkout(Path(model_path))
+        try:
+            yield entry.runtime
+        finally:
+            with self._lock:
+                entry.refs -= 1
+                self._evict_over_budget()
+
+    def _checkout(self, path: Path) -> _PoolEntry:
+        # Cheap thanks to the hash index; also catches a model file replaced under the same path
+        model_hash = self.hash_index.hash_file(path)
+
+        with self._lock:
+            entry = self._entries.get(model_hash)
+            if entry:
+                self.hits += 1
+                entry.refs += 1
+                self._entries.move_to_end(model_hash)
+                return entry
+            loading = self._loading.setdefault(model_hash, threading.Lock())
+
+        # Load outside the pool lock; concurrent misses for the same model wait for one load
+        with loading:
+            with self._lock:
+                entry = self._entries.get(model_hash)
+                if entry:
+                    self.hits += 1
+                    entry.refs += 1
+                    self._entries.move_to_end(model_hash)
+                    return entry
+
+            try:
+                backend = self.backend_factory(path, model_hash)
+                runtime = SecureRuntime(str(path), hash_index=self.hash_index, backend=backend)
+                size = backend.memory_bytes or path.stat().st_size
+
+                with self._lock:
+                    self.misses += 1
+                    entry = _PoolEntry(runtime, size)
+                    entry.refs += 1
+                    self._entries[model_hash] = entry
+                    self._evict_over_budget()
+                    return entry
+            finally:
+                # Also after a failed load, so no stale lock is left behind; waiters retry the load
+                with self._lock:
+                    self._loading.pop(model_hash, None)
+
+    def _evict_over_budget(self):
+        # Caller holds self._lock
+        for model_hash in list(self._entries):
+            if self.memory_bytes <= self.memory_budget_bytes:
+                break
+            entry = self._entries[model_hash]
+            if entry.refs > 0:
+                continue
+            del self._entries[model_hash]
+            entry.runtime.backend.close()
+            self.evictions += 1
+
+    def evict(self, model_hash: str) -> bool:
+        """
+        Drops a model from the pool if it is not in use.
+        """
+        with self._lock:
+            entry = self._entries.get(model_hash)
+            if not entry or entry.refs > 0:
+                return False
+            del self._entries[model_hash]
+            entry.runtime.backend.close()
+            self.evictions += 1
+            return True
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(entry.size for entry in self._entries.values())
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "loaded": len(self._entries),
+                "memory_bytes": self.memory_bytes,
+                "memory_budget_bytes": self.memory_budget_bytes,
+            }
@@ -1,25 +1,85 @@
 import hashlib
 import json
+import os
 import time
-from typing import Dict, Any
-from .identity import DIDManager
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+from cryptography.exceptions import InvalidSignature
+from .identity import DIDManager, resolve_did_key
+from .credential import Credential, splice_trace_json
+from .merkle import hash_leaf, merkle_levels, merkle_path, root_from_path
+
+SINGLE_PROOF_TYPE = "Ed25519Signature2020"
+BATCH_PROOF_TYPE = "Ed25519MerkleBatchSignature2020"
 
 class ProofGenerator:
     def __init__(self, did_manager: DIDManager = None):
         self.did_manager = did_manager if did_manager else DIDManager()
 
-    def generate_proof(self, trace: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_proof(self, trace: Dict[str, Any]) -> Credential:
         """
         Wraps the execution trace into a W3C Verifiable Credential.
         """
-        # Canonicalize the trace to ensure consistent hashing
-        trace_json = json.dumps(trace, sort_keys=True)
-        trace_hash = hashlib.sha256(trace_json.encode('utf-8')).hexdigest()
-        
         issuance_date = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        credential = self._build_credential(trace, issuance_date)
+        
+        # Sign the credential (reusing its canonical bytes rather than re-serializing)
+        signature = self.did_manager.sign_bytes(credential.unsigned_bytes())
+        
+        # Append Proof
+        credential["proof"] = {
+            "type": SINGLE_PROOF_TYPE,
+            "created": issuance_date,
+            "verificationMethod": self.did_manager.get_verification_method(),
+            "proofPurpose": "assertionMethod",
+            "jws": signature # Simplified JWS-like hex for hackathon
+        }
         
+        return credential
+
+    def generate_proofs(self, traces: List[Dict[str, Any]]) -> List[Credential]:
+        """
+        Wraps many traces into credentials that share a single signature.
+        A Merkle tree is built over the canonical credentials and only its root is signed;
+        each credential carries its inclusion path, so verifying one proof costs
+        O(log N) hashes plus one signature check instead of N signatures to issue.
+        """
+        if not traces:
+            return []
+
+        issuance_date = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        credentials = [self._build_credential(trace, issuance_date) for trace in traces]
+        leaves = [hash_leaf(c.unsigned_bytes()) for c in credentials]
+        levels = merkle_levels(leaves)
+        root = levels[-1][0]
+
+        # Sign the batch root once
+        signature = self.did_manager.sign_bytes(root)
+        verification_method = self.did_manager.get_verification_method()
+
+        for index, credential in enumerate(credentials):
+            credential["proof"] = {
+                "type": BATCH_PROOF_TYPE,
+                "created": issuance_date,
+                "verificationMethod": verification_method,
+                "proofPurpose": "assertionMethod",
+                "merkleRoot": root.hex(),
+                "merklePath": [{"position": position, "hash": sibling.hex()} for position, sibling in merkle_path(levels, index)],
+                "leafIndex": index,
+                "batchSize": len(credentials),
+                "jws": signature # Signature over the raw Merkle root bytes
+            }
+
+        return credentials
+
+    def _build_credential(self, trace: Dict[str, Any], issuance_date: str) -> Credential:
+        # Canonicalize the trace to ensure consistent hashing (the only time it is serialized)
+        trace_json = json.dumps(trace, sort_keys=True)
+        trace_hash = hashlib.sha256(trace_json.encode('utf-8')).hexdigest()
+
         # VC Structure
-        credential = {
+        return Credential({
             "@context": [
                 "https://www.w3.org/2018/credentials/v1",
                 "https://w3id.org/argus/v1"
@@ -32,45 +92,92 @@ class ProofGenerator:
                 "executionTrace": trace,
                 "traceHash": trace_hash
             }
-        }
-        
-        # Sign the credential
-        signature = self.did_manager.sign_payload(credential)
-        
-        # Append Proof
-        credential["proof"] = {
-            "type": "Ed25519Signature2020",
-            "created": issuance_date,
-            "verificationMethod": self.did_manager.get_verification_method(),
-            "proofPurpose": "assertionMethod",
-            "jws": signature # Simplified JWS-like hex for hackathon
-        }
-        
-        return credential
+        }, trace_json=trace_json)
 
     @staticmethod
     def verify_proof(proof: Dict[str, Any]) -> bool:
         """
-        Verifies the integrity of the VC.
+        Verifies the integrity of the VC and its issuer signature.
         """
-        # 1. Check Structure
-        if "credentialSubject" not in proof or "proof" not in proof:
+        # 1. Check Structure (malformed input is an invalid proof, not an error)
+        if not isinstance(proof, dict) or "credentialSubject" not in proof or "proof" not in proof:
+            return False
+        subject = proof["credentialSubject"]
+        if not isinstance(subject, dict):
             return False
             
         # 2. Re-calculate Trace Hash
-        trace = proof["credentialSubject"].get("executionTrace")
-        target_hash = proof["credentialSubject"].get("traceHash")
+        trace = subject.get("executionTrace")
+        target_hash = subject.get("traceHash")
         
-        if not trace or not target_hash:
+        if not trace or not target_hash or not isinstance(trace, dict) or not isinstance(target_hash, str):
             return False
             
-        recalculated_hash = hashlib.sha256(json.dumps(trace, sort_keys=True).encode('utf-8')).hexdigest()
+        trace_json = json.dumps(trace, sort_keys=True)
+        recalculated_hash = hashlib.sha256(trace_json.encode('utf-8')).hexdigest()
         
         if recalculated_hash != target_hash:
             return False
-            
-        # 3. Verify Signature (Simulated for this step, would import pubkey from DID in real DID resolver)
-        # In a real system we would resolve proof['issuer'] -> get pubkey -> verify proof['proof']['jws']
-        # For now, we trust the hash integrity check.
+
+        # 3. The signing key must belong to the issuer
+        signature_block = proof["proof"]
+        issuer = proof.get("issuer")
+        if not isinstance(signature_block, dict) or not isinstance(issuer, str) or not isinstance(signature_block.get("jws"), str):
+            return False
+        verification_method = signature_block.get("verificationMethod", issuer)
+        if not isinstance(verification_method, str) or not verification_method.startswith(issuer):
+            return False
+
+        # The unsigned credential reuses the trace serialization from step 2
+        unsigned_bytes = splice_trace_json(proof, trace_json, include_proof=False).encode('utf-8')
+
+        # 4. Batch-signed proofs: the credential must be included under the signed Merkle root
+        if signature_block.get("type") == BATCH_PROOF_TYPE:
+            try:
+                path = [(step["position"], bytes.fromhex(step["hash"])) for step in proof["proof"]["merklePath"]]
+                root = root_from_path(hash_leaf(unsigned_bytes), path)
+                if root.hex() != proof["proof"]["merkleRoot"]:
+                    return False
+            except (KeyError, TypeError, ValueError, AttributeError):
+                return False
+
+            # Every proof in a batch shares the root signature, so it is checked once per process
+            return _verify_root_signature(issuer, signature_block["jws"], signature_block["merkleRoot"])
+
+        # 5. Verify Signature: resolve the issuer DID to its public key and check the JWS over the unsigned credential
+        return _verify_signature(issuer, signature_block["jws"], unsigned_bytes)
+
+    @staticmethod
+    def verify_many(proofs: List[Dict[str, Any]], processes: Optional[int] = None, chunksize: int = 256) -> List[bool]:
+        """
+        Verifies many proofs across a process pool, returning verdicts in input order.
+        processes=1 verifies in the calling process.
+        A proof that cannot be verified at all counts as invalid rather than failing the batch.
+        """
+        processes = processes or os.cpu_count() or 1
+        if processes == 1 or len(proofs) <= chunksize:
+            return [_verify_or_false(p) for p in proofs]
+
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            return list(pool.map(_verify_or_false, proofs, chunksize=chunksize))
+
+def _verify_or_false(proof: Any) -> bool:
+    # Module-level so the process pool can pickle it
+    try:
+        return ProofGenerator.verify_proof(proof)
+    except Exception:
+        return False
+
+def _verify_signature(issuer: str, signature_hex: str, message: bytes) -> bool:
+    try:
+        resolve_did_key(issuer).verify(bytes.fromhex(signature_hex), message)
         return True
+    except (InvalidSignature, ValueError, TypeError):
+        return False
 
+@lru_cache(maxsize=4096)
+def _verify_root_signature(issuer: str, signature_hex: str, root_hex: str) -> bool:
+    try:
+        return _verify_signature(issuer, signature_hex, bytes.fromhex(root_hex))
+    except ValueError:
+        return False
@@ -1,56 +1,198 @@
+import asyncio
 from pathlib import Path
-from typing import Optional, Dict, Any
-from .hasher import ModelHasher
+from typing import Optional, Dict, Any, List, Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor
+from .hasher import ModelHasher, ModelHashIndex
+from .backends import ModelBackend, SimulatedBackend
+from .cache import ResultCache
 from .constraints import ConstraintEngine, PrivacyEngine
 from .proof import ProofGenerator
 import time
 
 class SecureRuntime:
-    def __init__(self, model_path: str):
+    def __init__(self, model_path: str, hash_index: Optional[ModelHashIndex] = None, use_hash_cache: bool = True, merkle_leaf_size: Optional[int] = None, hash_workers: Optional[int] = None,
+                 backend: Optional[ModelBackend] = None, max_concurrency: int = 64, executor: Optional[Executor] = None,
+                 result_cache: Optional[ResultCache] = None):
         self.model_path = Path(model_path)
         if not self.model_path.exists():
             raise FileNotFoundError(f"Model not found at {self.model_path}")
-        
+
         # Calculate model hash on initialization to "lock" it
-        self.model_hash = ModelHasher.hash_file(self.model_path)
+        # The sidecar index skips the full read when the file is unchanged since the last run
+        if use_hash_cache:
+            self.hash_index = hash_index if hash_index else ModelHashIndex()
+            self.model_hash = self.hash_index.hash_file(self.model_path)
+        else:
+            self.hash_index = None
+            self.model_hash = ModelHasher.hash_file(self.model_path)
+
+        # Optional tree hash: recorded next to the flat SHA-256 so partial updates can be verified per leaf
+        self.merkle_leaf_size = merkle_leaf_size
+        self.model_merkle_root = None
+        if merkle_leaf_size:
+            if self.hash_index:
+                self.model_merkle_root = self.hash_index.merkle_root(self.model_path, merkle_leaf_size, hash_workers)
+            else:
+                self.model_merkle_root = ModelHasher.merkle_root(self.model_path, merkle_leaf_size, hash_workers)
+
         self.proof_generator = ProofGenerator()
-        
+
+        # Inference backend (simulated unless a real one is plugged in)
+        self.backend = backend if backend else SimulatedBackend(self.model_hash, model_path=self.model_path)
+        self.backend.load()
+
+        # Async path: at most max_concurrency model calls in flight, run on this executor
+        self.max_concurrency = max_concurrency
+        self._executor = executor
+        self._semaphore: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+        # Opt-in memoization of outputs for deterministic models
+        self.result_cache = result_cache
+
     def execute(self, input_data: str, constraints: Dict[str, Any] = {}, metadata: Dict[str, Any] = {}) -> Dict[str, Any]:
         """
         Executes the model with the given input and constraints.
         Returns a Cryptographic Proof of execution.
         """
+        constraint_engine = ConstraintEngine(constraints)
+        constraint_engine.validate_model(self.model_hash)
+        trace = self._run_trace(input_data, constraint_engine, constraints, metadata)
+        return self.proof_generator.generate_proof(trace)
+
+    async def execute_async(self, input_data: str, constraints: Dict[str, Any] = {}, metadata: Dict[str, Any] = {}) -> Dict[str, Any]:
+        """
+        Coroutine version of execute for event-loop hosts (FastAPI, async nodes).
+        The model call runs on an executor under the concurrency limit; hashing,
+        privacy checks and proof generation run on the loop between in-flight calls.
+        """
+        constraint_engine = ConstraintEngine(constraints)
+        constraint_engine.validate_model(self.model_hash)
+
+        start_time = time.time()
+        input_hash, redacted_input, zkp_proofs = self._prepare(input_data, constraint_engine, constraints)
+
+        cache_key, cached = self._cache_lookup(input_hash, constraints)
+        if cached:
+            output = cached["output"]
+        else:
+            model_start = time.time()
+            async with self._get_semaphore():
+                output = await self.backend.predict_async(input_data, self._get_executor())
+            self._cache_store(cache_key, output, model_start)
+
+        trace = self._build_trace(start_time, input_hash, redacted_input, zkp_proofs, constraints, output, metadata, cache_key, cached)
+        return self.proof_generator.generate_proof(trace)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # asyncio primitives bind to the loop that first uses them
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            self._semaphore = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._semaphore[1]
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="argus-model")
+        return self._executor
+
+    def execute_batch(self, inputs: List[str], constraints: Dict[str, Any] = {}, metadata: Dict[str, Any] = {}, max_workers: int = 8, batch_sign: bool = True) -> List[Dict[str, Any]]:
+        """
+        Executes the model over many inputs sharing one policy.
+        The policy is parsed and the model hash is checked once for the whole batch,
+        then inputs run through a bounded worker pool.
+        With batch_sign, all successful traces share one Merkle-root signature.
+        Returns one result per input, in input order: {"proof": ..., "error": None}
+        on success or {"proof": None, "error": "..."} if that input failed.
+        """
+        # A policy violation on the model applies to every input, so fail the batch up front
+        constraint_engine = ConstraintEngine(constraints)
+        constraint_engine.validate_model(self.model_hash)
+
+        if not inputs:
+            return []
+
+        # Privacy predicates are evaluated column-wise over the whole batch in one pass
+        privacy_results = [None] * len(inputs)
+        if "privacy" in constraints:
+            privacy_results = PrivacyEngine.apply_privacy_rules_batch(inputs, constraints["privacy"], return_exceptions=True)
+
+        def run_one(item) -> Dict[str, Any]:
+            input_data, privacy_result = item
+            try:
+                trace = self._run_trace(input_data, constraint_engine, constraints, metadata, privacy_result)
+                proof = None if batch_sign else self.proof_generator.generate_proof(trace)
+                return {"proof": proof, "error": None, "trace": trace}
+            except Exception as e:
+                return {"proof": None, "error": str(e), "trace": None}
+
+        workers = max(1, min(max_workers, len(inputs)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # map() preserves input order regardless of completion order
+            results = list(pool.map(run_one, zip(inputs, privacy_results)))
+
+        if batch_sign:
+            succeeded = [r for r in results if r["error"] is None]
+            for result, proof in zip(succeeded, self.proof_generator.generate_proofs([r["trace"] for r in succeeded])):
+                result["proof"] = proof
+
+        for result in results:
+            del result["trace"]
+        return results
+
+    def _run_trace(self, input_data: str, constraint_engine: ConstraintEngine, constraints: Dict[str, Any], metadata: Dict[str, Any], privacy_result: Any = None) -> Dict[str, Any]:
+        """
+        Runs a single input against an already validated policy and returns its unsigned trace.
+        privacy_result optionally carries this input's precomputed (redacted_input, zkp_proofs).
+        """
         start_time = time.time()
-        
+        input_hash, redacted_input, zkp_proofs = self._prepare(input_data, constraint_engine, constraints, privacy_result)
+
+        # 3. Execution
+        # We use ORIGINAL input for execution (the model sees the data),
+        # but the PROOF will only see redacted data.
+        cache_key, cached = self._cache_lookup(input_hash, constraints)
+        if cached:
+            output = cached["output"]
+        else:
+            model_start = time.time()
+            output = self.backend.predict(input_data)
+            self._cache_store(cache_key, output, model_start)
+
+        return self._build_trace(start_time, input_hash, redacted_input, zkp_proofs, constraints, output, metadata, cache_key, cached)
+
+    def _cache_lookup(self, input_hash: str, constraints: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        if not self.result_cache:
+            return None, None
+        key = ResultCache.make_key(self.model_hash, input_hash, constraints)
+        return key, self.result_cache.get(key)
+
+    def _cache_store(self, cache_key: Optional[str], output: str, model_start: float):
+        if cache_key:
+            self.result_cache.put(cache_key, output, (time.time() - model_start) * 1000)
+
+    def _prepare(self, input_data: str, constraint_engine: ConstraintEngine, constraints: Dict[str, Any], privacy_result: Any = None) -> Tuple[str, str, List[str]]:
         # 1. Input Hashing (Hash the ORIGINAL input to bind the proof to it privately)
         input_hash = ModelHasher.hash_string(input_data)
-        
+
         # 2. Constraint & Privacy Checking
-        constraint_engine = ConstraintEngine(constraints)
-        constraint_engine.validate_model(self.model_hash)
         constraint_engine.validate_input(input_data)
-        
+
         # Privacy: Redact sensitive data if privacy rules exist
         redacted_input = input_data
         zkp_proofs = []
-        if "privacy" in constraints:
+        if isinstance(privacy_result, Exception):
+            raise privacy_result
+        if privacy_result is not None:
+            redacted_input, zkp_proofs = privacy_result
+        elif "privacy" in constraints:
             redacted_input, zkp_proofs = PrivacyEngine.apply_privacy_rules(input_data, constraints["privacy"])
-        
-        # 3. Execution (Simulated for MVP)
-        # We use ORIGINAL input for execution (the model sees the data), 
-        # but the PROOF will only see redacted data.
-        time.sleep(0.1) 
-        
-        # SMART SIMULATION FOR DEMO SCENARIOS
-        if "Credit Score" in input_data or "score" in input_data:
-            output = "SYS: LOAN_APPROVED | SCORE: Verified > Threshold | REASON: Strong Credit History"
-        elif "Chest Pain" in input_data:
-            output = "TRIAGE: PRIORITY_1_RED | ACTION: IMMEDIATE_ER_ADMISSION | SUSPICION: ACUTE_CORONARY_SYNDROME"
-        else:
-            output = f"Processed request by model [{self.model_hash[:8]}...]"
-        
+
+        return input_hash, redacted_input, zkp_proofs
+
+    def _build_trace(self, start_time: float, input_hash: str, redacted_input: str, zkp_proofs: List[str], constraints: Dict[str, Any], output: str, metadata: Dict[str, Any],
+                     cache_key: Optional[str] = None, cached: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         execution_time = time.time() - start_time
-        
+
         # 4. Generate Trace
         trace = {
             "model_hash": self.model_hash,
@@ -62,11 +204,19 @@ class SecureRuntime:
             "execution_time_ms": int(execution_time * 1000),
             "executed_at": time.time()
         }
-        
+
+        if self.model_merkle_root:
+            trace["model_merkle_root"] = self.model_merkle_root
+            trace["model_merkle_leaf_size"] = self.merkle_leaf_size
+
+        # Provenance: the output was replayed from the result cache, not recomputed
+        if cached:
+            trace["cached_result"] = {
+                "cache_key": cache_key,
+                "cached_at": cached["cached_at"]
+            }
+
         # Merge metadata (e.g. model_name)
         trace.update(metadata)
-        
-        # 5. Generate Proof
-        proof = self.proof_generator.generate_proof(trace)
-        
-        return proof
+
+        return trace
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, create_engine
+import os
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, create_engine, event, inspect
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
 from datetime import datetime
 
@@ -28,21 +29,64 @@ class VerificationRequest(Base):
     __tablename__ = 'verification_requests'
     id = Column(Integer, primary_key=True)
     req_uuid = Column(String, unique=True) # Public UUID
-    requester_id = Column(Integer, ForeignKey('users.id'))
+    requester_id = Column(Integer, ForeignKey('users.id'), index=True)
     model_name = Column(String)
     input_context = Column(String) # e.g. "Loan Application #999"
-    status = Column(String, default="PENDING") # PENDING, VERIFIED, FLAGGED
+    status = Column(String, default="PENDING", index=True) # PENDING, IN_PROGRESS, VERIFIED, FLAGGED
     proof_cid = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    # Job lease held by a Sentinel node while the request is IN_PROGRESS
+    lease_owner = Column(String, nullable=True) # Node ID
+    lease_id = Column(String, nullable=True) # Token the holder must present to complete
+    lease_expires_at = Column(DateTime, nullable=True)
     
     requester = relationship("User", back_populates="requests")
 
+    # Composite indexes matching the keyset-paginated listings (filter, then created_at, id)
+    __table_args__ = (
+        Index("ix_verification_requests_status_created", "status", "created_at", "id"),
+        Index("ix_verification_requests_requester_created", "requester_id", "created_at", "id"),
+        Index("ix_verification_requests_status_lease", "status", "lease_expires_at"),
+    )
+
 # Database Setup (SQLite for Hackathon)
-engine = create_engine('sqlite:///silverlock.db', connect_args={"check_same_thread": False})
+# Pooled connections, one per API worker thread (see ARGUS_API_THREADS in the server)
+DB_POOL_SIZE = int(os.getenv("ARGUS_DB_POOL_SIZE", "16"))
+DB_MAX_OVERFLOW = int(os.getenv("ARGUS_DB_MAX_OVERFLOW", "16"))
+engine = create_engine('sqlite:///silverlock.db', connect_args={"check_same_thread": False, "timeout": 30},
+                       pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
+
+@event.listens_for(engine, "connect")
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    # WAL: readers don't block the writer and the writer doesn't block readers
+    cursor.execute("PRAGMA journal_mode=WAL")
+    # Durable at checkpoints rather than every commit; safe with WAL
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    # Wait for the write lock instead of failing with "database is locked"
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache per connection
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def _add_missing_columns(table):
+    # create_all never alters existing tables; new nullable columns can be added in place
+    existing = {column["name"] for column in inspect(engine).get_columns(table.name)}
+    with engine.begin() as conn:
+        for column in table.columns:
+            if column.name not in existing:
+                conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(dialect=engine.dialect)}")
+
 def init_db():
     Base.metadata.create_all(bind=engine)
+    # Bring databases created by earlier versions up to date: new columns, then new indexes
+    _add_missing_columns(VerificationRequest.__table__)
+    for index in VerificationRequest.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
     
     # SEED DATA
     db = SessionLocal()
@@ -0,0 +1,240 @@
+import queue
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from sentinel.core.pool import ModelPool
+
+class HeadlessNode:
+    """
+    Production Sentinel node: leases jobs in batches and runs them through
+    overlapping stages instead of one job at a time.
+
+      lease (caller thread) -> execute (`workers` threads sharing the warm ModelPool)
+        -> save proof (`workers` threads) -> complete + broadcast (one thread, batched)
+
+    Uploading and completing job K overlap with executing job K+1. At most
+    2 x workers jobs are leased at once, so the executors never wait on the
+    network, and the leases being held stay small. A job that fails to execute
+    or upload is left leased; the API hands it to another node once the lease expires.
+
+    Every report_interval seconds it logs throughput and queue lag, which is
+    how long jobs waited in the queue before this node leased them (measured
+    against the API's UTC created_at).
+    """
+    def __init__(self, api_url: str, node_id: str, model_pool: ModelPool, proof_sink: Any,
+                 resolve_model: Callable[[str], Path], constraints: Dict[str, Any], workers: int = 4,
+                 lease_seconds: float = 60.0, interval: float = 3.0, push: bool = False, broadcast: bool = True,
+                 report_interval: float = 10.0, log: Callable[[str], None] = print, status: Optional[Callable[[], str]] = None):
+        self.api_url = api_url.rstrip("/")
+        self.node_id = node_id
+        self.model_pool = model_pool
+        self.proof_sink = proof_sink
+        self.resolve_model = resolve_model
+        self.constraints = constraints
+        self.workers = max(1, workers)
+        self.max_in_flight = 2 * self.workers
+        self.lease_seconds = lease_seconds
+        self.interval = interval
+        self.push = push
+        self.broadcast = broadcast
+        self.report_interval = report_interval
+        self.log = log
+        self.status = status
+
+        self._session = requests.Session()
+        self._slots = threading.Semaphore(self.max_in_flight)
+        self._completions: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.lost = 0
+        self._in_flight = 0
+        self._lags: List[float] = []
+        self._started = self._last_report = time.monotonic()
+        self._reported = 0
+
+    # --- Public API ---
+
+    def run(self):
+        """
+        Leases and processes jobs until stop() is called or Ctrl+C, then drains the jobs in flight.
+        """
+        execute_pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="argus-exec")
+        upload_pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="argus-upload")
+        completer = threading.Thread(target=self._complete_loop, name="argus-complete", daemon=True)
+        completer.start()
+        self._started = self._last_report = time.monotonic()
+        try:
+            self._lease_loop(execute_pool, upload_pool)
+        except KeyboardInterrupt:
+            self._stop.set()
+        finally:
+            # Jobs already leased are finished and completed before returning
+            execute_pool.shutdown(wait=True)
+            upload_pool.shutdown(wait=True)
+            self._completions.put(None)
+            completer.join()
+            self._report(final=True)
+
+    def stop(self):
+        self._stop.set()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"completed": self.completed, "failed": self.failed, "lost": self.lost, "in_flight": self._in_flight}
+
+    # --- Stages ---
+
+    def _lease_loop(self, execute_pool: ThreadPoolExecutor, upload_pool: ThreadPoolExecutor):
+        queue_seq = None
+        while not self._stop.is_set():
+            if time.monotonic() - self._last_report >= self.report_interval:
+                self._report()
+
+            # Wait for at least one free slot, then claim as many as are free (up to one batch)
+            if not self._slots.acquire(timeout=0.5):
+                continue
+            free = 1
+            while free < self.workers and self._slots.acquire(blocking=False):
+                free += 1
+
+            try:
+                if self.push and queue_seq is None:
+                    queue_seq = self._session.get(f"{self.api_url}/api/events/queue/poll", params={"timeout": 0}, timeout=10).json()["seq"]
+                lease = self._session.post(f"{self.api_url}/api/lease", json={"node_id": self.node_id, "limit": free, "lease_seconds": self.lease_seconds}, timeout=30).json()
+                jobs = lease["requests"]
+            except Exception:
+                self._release(free)
+                self.log("[red]Connection Lost. Retrying...[/red]")
+                self._stop.wait(self.interval)
+                continue
+
+            self._release(free - len(jobs))
+            leased_at = datetime.utcnow()
+            with self._lock:
+                self._in_flight += len(jobs)
+                self._lags.extend((leased_at - datetime.fromisoformat(job["created_at"])).total_seconds() for job in jobs)
+            for job in jobs:
+                execute_pool.submit(self._execute, job, lease["lease_id"], upload_pool)
+
+            if not jobs:
+                if self.push:
+                    # Returns as soon as a request is created (or a lease is released)
+                    try:
+                        res = self._session.get(f"{self.api_url}/api/events/queue/poll", params={"since": queue_seq, "timeout": min(25, self.report_interval)}, timeout=35)
+                        queue_seq = res.json()["seq"]
+                    except Exception:
+                        queue_seq = None
+                        self._stop.wait(self.interval)
+                else:
+                    self._stop.wait(self.interval)
+
+    def _execute(self, job: Dict[str, Any], lease_id: str, upload_pool: ThreadPoolExecutor):
+        try:
+            with self.model_pool.acquire(self.resolve_model(job["model_name"])) as runtime:
+                proof = runtime.execute(job["input_context"], self.constraints, metadata={"model_name": job["model_name"]})
+        except Exception as e:
+            self._fail(job, f"execution failed: {e}")
+            return
+        upload_pool.submit(self._upload, job, lease_id, proof)
+
+    def _upload(self, job: Dict[str, Any], lease_id: str, proof: Dict[str, Any]):
+        try:
+            cid = self.proof_sink.save_proof(proof)
+        except Exception as e:
+            self._fail(job, f"upload failed: {e}")
+            return
+        self._completions.put({"req_uuid": job["req_uuid"], "proof_cid": cid, "status": "VERIFIED", "lease_id": lease_id,
+                               "model_hash": proof["credentialSubject"]["executionTrace"]["model_hash"]})
+
+    def _complete_loop(self):
+        session = requests.Session()
+        done = False
+        while not done:
+            # Block for the first result, then take whatever else is ready so completions go out in batches
+            batch = []
+            item = self._completions.get()
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= 500:
+                    break
+                try:
+                    item = self._completions.get_nowait()
+                except queue.Empty:
+                    break
+            done = item is None
+            if batch:
+                self._complete_batch(session, batch)
+
+    def _complete_batch(self, session: requests.Session, batch: List[Dict[str, Any]]):
+        payload = [{k: item[k] for k in ("req_uuid", "proof_cid", "status", "lease_id")} for item in batch]
+        results = None
+        for attempt in range(3):
+            try:
+                res = session.post(f"{self.api_url}/api/complete/batch", json=payload, timeout=30)
+                res.raise_for_status()
+                results = res.json()["results"]
+                break
+            except Exception as e:
+                self.log(f"[red]Failed to sync {len(batch)} results (attempt {attempt + 1}): {e}[/red]")
+                time.sleep(self.interval)
+        if results is None:
+            # Left leased: the API re-queues them when the lease expires
+            with self._lock:
+                self.failed += len(batch)
+                self._in_flight -= len(batch)
+            self._release(len(batch))
+            return
+
+        updated = [item for item, result in zip(batch, results) if result["status"] == "updated"]
+        with self._lock:
+            self.completed += len(updated)
+            self.lost += len(batch) - len(updated)
+            self._in_flight -= len(batch)
+        self._release(len(batch))
+
+        if self.broadcast:
+            for item in updated:
+                try:
+                    session.post(f"{self.api_url}/api/broadcast", json={"cid": item["proof_cid"], "type": "execution_proof", "model_hash": item["model_hash"]}, timeout=5)
+                except Exception:
+                    pass  # The feed is best effort; the request itself is already completed
+
+    # --- Helpers ---
+
+    def _release(self, n: int):
+        for _ in range(n):
+            self._slots.release()
+
+    def _fail(self, job: Dict[str, Any], reason: str):
+        self.log(f"[red]Job {job['req_uuid'][:8]} {reason}[/red]")
+        with self._lock:
+            self.failed += 1
+            self._in_flight -= 1
+        self._release(1)
+
+    def _report(self, final: bool = False):
+        now = time.monotonic()
+        with self._lock:
+            completed, lags = self.completed, self._lags
+            self._lags = []
+            failed, lost, in_flight = self.failed, self.lost, self._in_flight
+        overall = completed / max(now - self._started, 1e-9)
+        counts = f"completed {completed} failed {failed} lost {lost}"
+        if final:
+            self.log(f"[bold]Stopped[/bold] | {counts} | avg {overall:.1f} jobs/s over {now - self._started:.0f}s")
+            return
+
+        rate = (completed - self._reported) / max(now - self._last_report, 1e-9)
+        self._reported, self._last_report = completed, now
+        lag = f"queue lag p50 {statistics.median(lags):.2f}s max {max(lags):.2f}s" if lags else "queue lag -"
+        extra = f" | {self.status()}" if self.status else ""
+        self.log(f"{time.strftime('%H:%M:%S')} | {rate:.1f} jobs/s (avg {overall:.1f}) | {counts} | in flight {in_flight} | {lag}{extra}")
@@ -0,0 +1,46 @@
+import hashlib
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+# Default `ipfs add` chunk size; files up to this size are stored as a single block
+DEFAULT_CHUNK_SIZE = 262144
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+def _base58_encode(data: bytes) -> str:
+    number = int.from_bytes(data, "big")
+    encoded = ""
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded = BASE58_ALPHABET[remainder] + encoded
+    leading_zeros = len(data) - len(data.lstrip(b"\x00"))
+    return "1" * leading_zeros + encoded
+
+def compute_cid_v0(content: bytes) -> str:
+    """
+    Computes the CIDv0 that `ipfs add` (default settings) assigns to a file,
+    without talking to a node. Only valid for single-chunk files.
+    """
+    if len(content) > DEFAULT_CHUNK_SIZE:
+        raise ValueError(f"Local CID computation only supports files up to {DEFAULT_CHUNK_SIZE} bytes")
+
+    # UnixFS Data message: Type=File, Data=content, filesize
+    unixfs = b"\x08\x02"
+    if content:
+        unixfs += b"\x12" + _varint(len(content)) + content
+    unixfs += b"\x18" + _varint(len(content))
+
+    # dag-pb PBNode with only the Data field (a single block has no links)
+    node = b"\x0a" + _varint(len(unixfs)) + unixfs
+
+    # sha2-256 multihash, base58btc
+    return _base58_encode(b"\x12\x20" + hashlib.sha256(node).digest())
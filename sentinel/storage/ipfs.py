@@ -1,76 +1,142 @@
-import json
+import random
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, Tuple
+from sentinel.core.credential import canonical_bytes
+from .local import LocalProofStore
 
 class IPFSStorage:
-    def __init__(self, host: str = "http://127.0.0.1:5001"):
+    # Shared by every instance in the process: one keep-alive pool and one cached health status per host
+    _sessions: Dict[str, requests.Session] = {}
+    _health: Dict[str, Tuple[bool, float]] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, host: str = "http://127.0.0.1:5001", local_store: Optional[LocalProofStore] = None,
+                 connect_timeout: float = 1.0, read_timeout: float = 30.0, retries: int = 3,
+                 backoff: float = 0.2, health_interval: float = 30.0, pool_size: int = 32):
         self.host = host.rstrip('/')
-        self.available = self._check_availability()
+        self._local_store = local_store
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.health_interval = health_interval
+        self.session = self._get_session(self.host, pool_size)
+
+    @classmethod
+    def _get_session(cls, host: str, pool_size: int) -> requests.Session:
+        with cls._shared_lock:
+            session = cls._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                cls._sessions[host] = session
+            return session
+
+    @property
+    def available(self) -> bool:
+        """
+        Cached IPFS availability; the node is re-probed at most once per health_interval.
+        """
+        status = IPFSStorage._health.get(self.host)
+        if status and time.monotonic() - status[1] < self.health_interval:
+            return status[0]
+        return self._refresh_availability()
+
+    def _refresh_availability(self) -> bool:
+        is_up = self._check_availability()
+        IPFSStorage._health[self.host] = (is_up, time.monotonic())
+        return is_up
+
+    def _mark_unavailable(self):
+        # Skip straight to the fallback until the next health check instead of timing out per call
+        IPFSStorage._health[self.host] = (False, time.monotonic())
+
+    @property
+    def local_store(self) -> LocalProofStore:
+        # Opened on first use so IPFS-only callers never touch the local index
+        if self._local_store is None:
+            self._local_store = LocalProofStore()
+        return self._local_store
         
     def _check_availability(self) -> bool:
         try:
             # Simple check to see if IPFS API is up
-            requests.post(f"{self.host}/api/v0/version", timeout=1)
+            self.session.post(f"{self.host}/api/v0/version", timeout=self.timeout[0])
             return True
-        except:
+        except requests.RequestException:
             return False
 
+    def _post(self, endpoint: str, **kwargs) -> requests.Response:
+        """
+        POSTs to the IPFS API over the pooled session, retrying connection errors
+        and 5xx responses with jittered exponential backoff.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                res = self.session.post(f"{self.host}{endpoint}", timeout=self.timeout, **kwargs)
+                if res.status_code < 500 or attempt == self.retries:
+                    res.raise_for_status()
+                    return res
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    self._mark_unavailable()
+                    raise
+            # Full jitter keeps many nodes from retrying in lockstep
+            time.sleep(random.uniform(0, self.backoff * (2 ** attempt)))
+
     def save_proof(self, proof: Dict[str, Any]) -> str:
         """
         Saves the proof to IPFS and returns the CID.
         If IPFS is not available, returns a mock CID.
         """
+        # Serialized once; the same bytes are uploaded, stored and content-addressed
+        content = canonical_bytes(proof)
         if self.available:
             try:
                 files = {
-                    'file': ('proof.json', json.dumps(proof))
+                    'file': ('proof.json', content)
                 }
-                res = requests.post(f"{self.host}/api/v0/add", files=files)
-                res.raise_for_status()
+                res = self._post("/api/v0/add", files=files)
                 return res.json()['Hash']
             except Exception as e:
                 print(f"Failed to upload to IPFS: {e}")
-                return self._mock_save(proof)
+                return self._mock_save(proof, content)
         else:
-            return self._mock_save(proof)
+            return self._mock_save(proof, content)
 
-    def _mock_save(self, proof: Dict[str, Any]) -> str:
+    def _mock_save(self, proof: Dict[str, Any], content: Optional[bytes] = None) -> str:
         # For development/demo without a running node
         import hashlib
-        import os
-        from pathlib import Path
         
-        content = json.dumps(proof).encode('utf-8')
+        if content is None:
+            content = canonical_bytes(proof)
         mock_cid = "QmMock" + hashlib.sha256(content).hexdigest()[:40]
         
-        # Save to local mock storage
-        storage_dir = Path("sentinel_storage")
-        storage_dir.mkdir(exist_ok=True)
-        with open(storage_dir / f"{mock_cid}.json", "w") as f:
-            f.write(json.dumps(proof))
+        # Save to the local content-addressed store
+        self.local_store.put(mock_cid, content, proof)
             
         return mock_cid
 
     def get_proof(self, cid: str) -> Optional[Dict[str, Any]]:
-        # Check mock storage first
+        # Check local storage first: mock proofs, plus write-behind proofs not yet uploaded
+        try:
+            proof = self.local_store.get_proof(cid)
+            if proof is not None:
+                return proof
+        except Exception as e:
+            print(f"Local storage error: {e}")
         if cid.startswith("QmMock"):
-            import os
-            from pathlib import Path
-            try:
-                storage_path = Path(f"sentinel_storage/{cid}.json")
-                if storage_path.exists():
-                    with open(storage_path, "r") as f:
-                        return json.load(f)
-            except Exception as e:
-                print(f"Mock storage error: {e}")
-                return None
+            return None
                 
         if self.available:
             try:
                 # Use the cat endpoint
                 params = {'arg': cid}
-                res = requests.post(f"{self.host}/api/v0/cat", params=params)
-                res.raise_for_status()
+                res = self._post("/api/v0/cat", params=params)
                 return res.json()
             except Exception as e:
                 print(f"Failed to fetch from IPFS: {e}")
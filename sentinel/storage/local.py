@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+class LocalProofStore:
+    """
+    Content-addressed local proof store.
+    Proofs live under hash-prefix shard directories (root/ab/cd/<cid>.json) so no
+    directory grows unbounded, and are written atomically (temp file + rename).
+    A SQLite index records CID, size, issuer, model_hash and timestamp for
+    O(1) lookups and fast range listings.
+    """
+    def __init__(self, root: Union[str, Path] = "sentinel_storage"):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.root / "index.sqlite"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS proofs (cid TEXT PRIMARY KEY, size INTEGER, issuer TEXT, model_hash TEXT, created_at REAL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS ix_proofs_created_at ON proofs (created_at, cid)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS ix_proofs_model_hash ON proofs (model_hash, created_at)")
+        self._db.commit()
+
+    def path_for(self, cid: str) -> Path:
+        # Shard on a hash of the CID so prefixes are uniform regardless of the CID format
+        digest = hashlib.sha256(cid.encode('utf-8')).hexdigest()
+        return self.root / digest[:2] / digest[2:4] / f"{cid}.json"
+
+    def _flat_path(self, cid: str) -> Path:
+        return self.root / f"{cid}.json"
+
+    def put(self, cid: str, content: bytes, proof: Optional[Dict[str, Any]] = None, created_at: Optional[float] = None):
+        """
+        Stores the content under its CID. Content-addressed, so rewriting an existing CID is a no-op.
+        """
+        path = self.path_for(cid)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        self._index(cid, content, proof, created_at if created_at is not None else time.time())
+
+    def _index(self, cid: str, content: bytes, proof: Optional[Dict[str, Any]], created_at: float):
+        if proof is None:
+            try:
+                proof = json.loads(content)
+            except ValueError:
+                proof = {}
+        issuer = proof.get("issuer") if isinstance(proof, dict) else None
+        try:
+            model_hash = proof["credentialSubject"]["executionTrace"].get("model_hash")
+        except (KeyError, TypeError, AttributeError):
+            model_hash = None
+
+        with self._lock:
+            self._db.execute("INSERT OR IGNORE INTO proofs VALUES (?, ?, ?, ?, ?)",
+                             (cid, len(content), issuer if isinstance(issuer, str) else None, model_hash, created_at))
+            self._db.commit()
+
+    def get(self, cid: str) -> Optional[bytes]:
+        for path in (self.path_for(cid), self._flat_path(cid)):  # Flat path covers stores not yet migrated
+            try:
+                with open(path, "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                continue
+        return None
+
+    def get_proof(self, cid: str) -> Optional[Dict[str, Any]]:
+        content = self.get(cid)
+        return json.loads(content) if content is not None else None
+
+    def __contains__(self, cid: str) -> bool:
+        return self.path_for(cid).exists() or self._flat_path(cid).exists()
+
+    def list(self, since: Optional[float] = None, until: Optional[float] = None, model_hash: Optional[str] = None,
+             after: Optional[tuple] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Lists indexed proofs ordered by (created_at, cid). Pass the last row's
+        (created_at, cid) as `after` to fetch the next page.
+        """
+        clauses, params = [], []
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(until)
+        if model_hash is not None:
+            clauses.append("model_hash = ?")
+            params.append(model_hash)
+        if after is not None:
+            clauses.append("(created_at, cid) > (?, ?)")
+            params.extend(after)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT cid, size, issuer, model_hash, created_at FROM proofs {where} ORDER BY created_at, cid LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+        return [dict(zip(("cid", "size", "issuer", "model_hash", "created_at"), row)) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM proofs").fetchone()[0]
+
+    def migrate_flat(self) -> int:
+        """
+        Moves proofs from the legacy flat layout (root/<cid>.json) into shards and indexes them.
+        Safe to re-run; returns the number of proofs migrated.
+        """
+        migrated = 0
+        for flat_path in sorted(self.root.glob("*.json")):
+            cid = flat_path.stem
+            with open(flat_path, "rb") as f:
+                content = f.read()
+            self.put(cid, content, created_at=flat_path.stat().st_mtime)
+            flat_path.unlink()
+            migrated += 1
+        return migrated
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,360 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Record: payload length, crc32 of payload, codec, CID length, then CID and payload
+RECORD_HEADER = struct.Struct(">IIBB")
+# Index entry: sha256(cid), record offset in its segment, record length
+INDEX_ENTRY = struct.Struct(">32sQI")
+INDEX_MAGIC = b"APIX\x00\x00\x00\x01"
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+CODEC_ZLIB_DICT = 2
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+MAX_DICTIONARY_SIZE = 32 * 1024  # zlib only looks back 32 KiB, so a longer zdict is wasted
+
+def build_dictionary(samples: Iterable[bytes], size: int = MAX_DICTIONARY_SIZE) -> bytes:
+    """
+    Builds a shared zlib dictionary from sample proofs.
+    Proofs repeat the same @context, type, issuer and constraint blocks, so a
+    few representative records already cover most of each new one.
+    zlib prefers matches near the end of the dictionary, so the most recent
+    samples are placed last.
+    """
+    dictionary = b""
+    seen = set()
+    for sample in samples:
+        if sample in seen:
+            continue
+        seen.add(sample)
+        dictionary += sample
+    return dictionary[-min(size, MAX_DICTIONARY_SIZE):]
+
+def _key(cid: str) -> bytes:
+    return hashlib.sha256(cid.encode("utf-8")).digest()
+
+class _Segment:
+    """
+    A sealed segment: an immutable pack file plus a sorted, mmap'ed offset index.
+    """
+    def __init__(self, pack_path: Path, index_path: Path):
+        self.pack_path = pack_path
+        self.index_path = index_path
+        with open(index_path, "rb") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._index[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError(f"Not a proof pack index: {index_path}")
+        self.count = (len(self._index) - len(INDEX_MAGIC)) // INDEX_ENTRY.size
+        with open(pack_path, "rb") as f:
+            self._pack = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else None
+
+    def _entry(self, i: int) -> Tuple[bytes, int, int]:
+        return INDEX_ENTRY.unpack_from(self._index, len(INDEX_MAGIC) + i * INDEX_ENTRY.size)
+
+    def locate(self, key: bytes) -> Optional[Tuple[int, int]]:
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            digest, offset, length = self._entry(mid)
+            if digest < key:
+                lo = mid + 1
+            elif digest > key:
+                hi = mid
+            else:
+                return offset, length
+        return None
+
+    def read(self, offset: int, length: int) -> bytes:
+        return self._pack[offset:offset + length]
+
+    def keys(self) -> Iterator[bytes]:
+        for i in range(self.count):
+            yield self._entry(i)[0]
+
+    def close(self):
+        self._index.close()
+        if self._pack is not None:
+            self._pack.close()
+
+class PackfileProofStore:
+    """
+    Append-only proof store for high proof volumes.
+    Proofs are appended to segment files (root/seg-NNNNNN.pack) as individually
+    compressed records, optionally against a shared zlib dictionary stored in
+    root/zdict.bin. When the active segment passes segment_size it is sealed:
+    a sorted offset index (seg-NNNNNN.idx) is written next to it and read via
+    mmap for binary-search lookups. compact() merges sealed segments and drops
+    duplicate records.
+
+    Exposes the same put/get/get_proof/__contains__/count/close interface as
+    LocalProofStore, so it can be passed to IPFSStorage as its local_store.
+    """
+    def __init__(self, root: Union[str, Path] = "sentinel_packs", segment_size: int = DEFAULT_SEGMENT_SIZE,
+                 dictionary: Optional[bytes] = None, compression_level: int = 6, fsync: bool = True):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+        self.compression_level = compression_level
+        self.fsync = fsync
+        self._lock = threading.Lock()
+
+        # The dictionary is fixed for the life of the store: existing records depend on it
+        dict_path = self.root / "zdict.bin"
+        if dict_path.exists():
+            self.dictionary = dict_path.read_bytes()
+            if dictionary is not None and dictionary != self.dictionary:
+                raise ValueError(f"{self.root} already uses a different compression dictionary")
+        else:
+            self.dictionary = dictionary
+            if dictionary:
+                self._atomic_write(dict_path, dictionary)
+
+        self._sealed: List[_Segment] = []
+        for index_path in sorted(self.root.glob("seg-*.idx")):
+            self._sealed.append(_Segment(index_path.with_suffix(".pack"), index_path))
+
+        # The active segment is the newest pack without an index; recover its offsets by scanning.
+        # Older packs without an index (a crash mid-seal or mid-compaction) are sealed now.
+        sealed_packs = {s.pack_path for s in self._sealed}
+        unsealed = [p for p in sorted(self.root.glob("seg-*.pack")) if p not in sealed_packs]
+        self._active_offsets: Dict[bytes, Tuple[int, int]] = {}
+        for pack_path in unsealed[:-1]:
+            self._active_path, self._active_offsets = pack_path, {}
+            self._recover_active()
+            index_path = pack_path.with_suffix(".idx")
+            self._write_index(index_path, self._active_offsets)
+            self._sealed.append(_Segment(pack_path, index_path))
+        self._sealed.sort(key=lambda s: s.pack_path)
+
+        self._active_offsets = {}
+        if unsealed:
+            self._active_path = unsealed[-1]
+            self._recover_active()
+        else:
+            self._active_path = self._segment_path(self._next_segment_number())
+        self._active = open(self._active_path, "ab+")
+
+    def _segment_path(self, number: int) -> Path:
+        return self.root / f"seg-{number:06d}.pack"
+
+    def _next_segment_number(self) -> int:
+        numbers = [int(p.stem.split("-")[1]) for p in self.root.glob("seg-*.pack")]
+        return max(numbers, default=0) + 1
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _scan(self, path: Path) -> Iterator[Tuple[str, int, int, int, bytes]]:
+        """
+        Yields (cid, offset, record_length, codec, payload) for each intact record.
+        Stops at the first torn or corrupt record (a crash mid-append).
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        offset = 0
+        while offset + RECORD_HEADER.size <= len(data):
+            payload_len, crc, codec, cid_len = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            end = start + cid_len + payload_len
+            if end > len(data):
+                return
+            payload = data[start + cid_len:end]
+            if zlib.crc32(payload) != crc:
+                return
+            yield data[start:start + cid_len].decode("utf-8"), offset, end - offset, codec, payload
+            offset = end
+
+    def _recover_active(self):
+        valid_end = 0
+        for cid, offset, length, _, _ in self._scan(self._active_path):
+            self._active_offsets.setdefault(_key(cid), (offset, length))
+            valid_end = offset + length
+        # Drop a torn tail so new appends start on a record boundary
+        if self._active_path.stat().st_size != valid_end:
+            os.truncate(self._active_path, valid_end)
+
+    def _encode(self, cid: str, content: bytes) -> bytes:
+        if self.dictionary:
+            compressor = zlib.compressobj(self.compression_level, zdict=self.dictionary)
+            codec = CODEC_ZLIB_DICT
+        else:
+            compressor = zlib.compressobj(self.compression_level)
+            codec = CODEC_ZLIB
+        payload = compressor.compress(content) + compressor.flush()
+        if len(payload) >= len(content):
+            codec, payload = CODEC_RAW, content
+        cid_bytes = cid.encode("utf-8")
+        return RECORD_HEADER.pack(len(payload), zlib.crc32(payload), codec, len(cid_bytes)) + cid_bytes + payload
+
+    def _decode(self, record: bytes) -> bytes:
+        payload_len, crc, codec, cid_len = RECORD_HEADER.unpack_from(record, 0)
+        payload = record[RECORD_HEADER.size + cid_len:]
+        if codec == CODEC_RAW:
+            return payload
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(payload)
+        if codec == CODEC_ZLIB_DICT:
+            if not self.dictionary:
+                raise ValueError(f"{self.root} has dictionary-compressed records but no zdict.bin")
+            decompressor = zlib.decompressobj(zdict=self.dictionary)
+            return decompressor.decompress(payload) + decompressor.flush()
+        raise ValueError(f"Unknown proof record codec {codec}")
+
+    def _locate(self, key: bytes) -> Optional[Tuple[Optional[_Segment], int, int]]:
+        location = self._active_offsets.get(key)
+        if location:
+            return None, location[0], location[1]
+        for segment in reversed(self._sealed):
+            location = segment.locate(key)
+            if location:
+                return segment, location[0], location[1]
+        return None
+
+    def put(self, cid: str, content: bytes, proof: Optional[Dict[str, Any]] = None, created_at: Optional[float] = None):
+        """
+        Appends the content under its CID. Content-addressed, so rewriting an existing CID is a no-op.
+        proof and created_at are accepted for interface parity with LocalProofStore.
+        """
+        key = _key(cid)
+        record = self._encode(cid, content)
+        with self._lock:
+            if self._locate(key):
+                return
+            offset = self._active.seek(0, os.SEEK_END)
+            self._active.write(record)
+            self._active.flush()
+            if self.fsync:
+                os.fsync(self._active.fileno())
+            self._active_offsets[key] = (offset, len(record))
+            if offset + len(record) >= self.segment_size:
+                self._seal_active()
+
+    def _write_index(self, index_path: Path, offsets: Dict[bytes, Tuple[int, int]]):
+        entries = b"".join(INDEX_ENTRY.pack(key, offset, length) for key, (offset, length) in sorted(offsets.items()))
+        self._atomic_write(index_path, INDEX_MAGIC + entries)
+
+    def _seal_active(self):
+        self._active.close()
+        index_path = self._active_path.with_suffix(".idx")
+        self._write_index(index_path, self._active_offsets)
+        self._sealed.append(_Segment(self._active_path, index_path))
+        self._active_path = self._segment_path(self._next_segment_number())
+        self._active_offsets = {}
+        self._active = open(self._active_path, "ab+")
+
+    def get(self, cid: str) -> Optional[bytes]:
+        with self._lock:
+            location = self._locate(_key(cid))
+            if location is None:
+                return None
+            segment, offset, length = location
+            if segment is None:
+                record = os.pread(self._active.fileno(), length, offset)
+            else:
+                record = segment.read(offset, length)
+        return self._decode(record)
+
+    def get_proof(self, cid: str) -> Optional[Dict[str, Any]]:
+        content = self.get(cid)
+        return json.loads(content) if content is not None else None
+
+    def __contains__(self, cid: str) -> bool:
+        with self._lock:
+            return self._locate(_key(cid)) is not None
+
+    def count(self) -> int:
+        with self._lock:
+            keys = set(self._active_offsets)
+            for segment in self._sealed:
+                keys.update(segment.keys())
+            return len(keys)
+
+    def disk_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self.root.iterdir() if p.is_file())
+
+    def compact(self) -> Dict[str, int]:
+        """
+        Merges all sealed segments into as few segments as segment_size allows,
+        keeping one record per CID. The active segment is left untouched.
+        Returns {"segments_before", "segments_after", "bytes_before", "bytes_after"}.
+        """
+        with self._lock:
+            old = list(self._sealed)
+            bytes_before = sum(s.pack_path.stat().st_size + s.index_path.stat().st_size for s in old)
+            if len(old) < 2:
+                return {"segments_before": len(old), "segments_after": len(old), "bytes_before": bytes_before, "bytes_after": bytes_before}
+
+            # New segments are numbered after the active one so their order on reopen stays newest-last
+            number = self._next_segment_number()
+            new_segments: List[_Segment] = []
+            seen = set()
+            pack_path, pack, offsets = None, None, {}
+
+            def seal():
+                pack.flush()
+                os.fsync(pack.fileno())
+                pack.close()
+                index_path = pack_path.with_suffix(".idx")
+                self._write_index(index_path, offsets)
+                new_segments.append(_Segment(pack_path, index_path))
+
+            for segment in old:
+                for cid, offset, length, _, _ in self._scan(segment.pack_path):
+                    key = _key(cid)
+                    if key in seen or key in self._active_offsets:
+                        continue
+                    seen.add(key)
+                    if pack is None:
+                        pack_path = self._segment_path(number)
+                        number += 1
+                        pack, offsets = open(pack_path, "wb"), {}
+                    offsets[key] = (pack.tell(), length)
+                    pack.write(segment.read(offset, length))
+                    if pack.tell() >= self.segment_size:
+                        seal()
+                        pack = None
+            if pack is not None:
+                seal()
+
+            # Swap in the merged segments before removing the old files
+            self._sealed = new_segments
+            for segment in old:
+                segment.close()
+                segment.index_path.unlink()
+                segment.pack_path.unlink()
+
+            # Keep the active segment numbered after every sealed one
+            self._active.close()
+            active_path = self._segment_path(number)
+            os.replace(self._active_path, active_path)
+            self._active_path = active_path
+            self._active = open(self._active_path, "ab+")
+
+            bytes_after = sum(s.pack_path.stat().st_size + s.index_path.stat().st_size for s in new_segments)
+            return {"segments_before": len(old), "segments_after": len(new_segments), "bytes_before": bytes_before, "bytes_after": bytes_after}
+
+    def close(self):
+        with self._lock:
+            self._active.close()
+            for segment in self._sealed:
+                segment.close()
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import random
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .cid import DEFAULT_CHUNK_SIZE, _base58_encode, compute_cid_v0
+
+class LocalIPFSNode:
+    """
+    In-process stand-in for the subset of the IPFS HTTP API that IPFSStorage uses:
+    /api/v0/version, /api/v0/add (single and multi-file) and /api/v0/cat.
+    Content is kept in memory. Network conditions are simulated so storage
+    changes can be benchmarked reproducibly offline:
+      latency / jitter      seconds added to every request (uniform jitter on top)
+      failure_rate          fraction of add/cat requests answered with HTTP 500
+      throughput_bytes_per_s  shared cap on request + response bytes, like one uplink
+    Single-chunk files get the same CIDv0 a real node would assign; larger files
+    get a stable sha2-256 CID that does not match go-ipfs chunking.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 failure_rate: float = 0.0, throughput_bytes_per_s: Optional[float] = None, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.throughput_bytes_per_s = throughput_bytes_per_s
+        self.blocks: Dict[str, bytes] = {}
+        self.requests: Dict[str, int] = {"version": 0, "add": 0, "cat": 0, "failed": 0}
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._link_free_at = 0.0
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LocalIPFSNode":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="argus-ipfs-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "LocalIPFSNode":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --- Simulated network ---
+
+    def _delay(self, nbytes: int):
+        wait = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if self.throughput_bytes_per_s:
+            # Transfers queue on one shared link: each reserves its slot after the previous one
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._link_free_at)
+                self._link_free_at = start + nbytes / self.throughput_bytes_per_s
+                wait += self._link_free_at - now
+        if wait > 0:
+            time.sleep(wait)
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            return self.failure_rate > 0 and self._random.random() < self.failure_rate
+
+    # --- API ---
+
+    def add(self, files: List[Tuple[str, bytes]]) -> List[Dict[str, str]]:
+        added = []
+        for name, content in files:
+            if len(content) <= DEFAULT_CHUNK_SIZE:
+                cid = compute_cid_v0(content)
+            else:
+                cid = _base58_encode(b"\x12\x20" + hashlib.sha256(content).digest())
+            with self._lock:
+                self.blocks[cid] = content
+            added.append({"Name": name, "Hash": cid, "Size": str(len(content))})
+        return added
+
+    def cat(self, cid: str) -> Optional[bytes]:
+        with self._lock:
+            return self.blocks.get(cid)
+
+    def _handler_class(self):
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, so pooled client sessions are exercised
+            disable_nagle_algorithm = True  # Headers and body are separate writes; don't let delayed ACKs add latency
+
+            def log_message(self, format, *args):
+                pass
+
+            def _reply(self, status: int, body: bytes, content_type: str = "application/json"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _error(self, status: int, message: str):
+                self._reply(status, json.dumps({"Message": message, "Code": 0, "Type": "error"}).encode("utf-8"))
+
+            def do_GET(self):
+                # Like a real node, the RPC API only accepts POST
+                self._error(405, "method not allowed")
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                url = urlparse(self.path)
+                endpoint = url.path.rsplit("/", 1)[-1]
+
+                if endpoint == "version":
+                    with node._lock:
+                        node.requests["version"] += 1
+                    return self._reply(200, json.dumps({"Version": "0.0.0-argus-standin", "Commit": "", "Repo": "0"}).encode("utf-8"))
+                if endpoint not in ("add", "cat"):
+                    return self._error(404, f"unknown command {url.path}")
+
+                with node._lock:
+                    node.requests[endpoint] += 1
+                if node._should_fail():
+                    with node._lock:
+                        node.requests["failed"] += 1
+                    node._delay(len(body))
+                    return self._error(500, "simulated failure")
+
+                if endpoint == "add":
+                    files = self._parse_files(body)
+                    if not files:
+                        return self._error(400, "file argument 'path' is required")
+                    added = node.add(files)
+                    response = "".join(json.dumps(entry) + "\n" for entry in added).encode("utf-8")
+                    node._delay(len(body) + len(response))
+                    return self._reply(200, response)
+
+                cid = (parse_qs(url.query).get("arg") or [""])[0]
+                content = node.cat(cid)
+                node._delay(len(body) + len(content or b""))
+                if content is None:
+                    return self._error(500, f"block was not found locally (offline): {cid}")
+                self._reply(200, content, "text/plain")
+
+            def _parse_files(self, body: bytes) -> List[Tuple[str, bytes]]:
+                header = f"Content-Type: {self.headers.get('Content-Type', '')}\r\n\r\n".encode("latin-1")
+                message = BytesParser(policy=HTTP).parsebytes(header + body)
+                if not message.is_multipart():
+                    return []
+                return [(part.get_filename() or "", part.get_payload(decode=True) or b"") for part in message.iter_parts()]
+
+        return Handler
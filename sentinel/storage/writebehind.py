@@ -0,0 +1,211 @@
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from sentinel.core.credential import canonical_bytes
+from .cid import compute_cid_v0, DEFAULT_CHUNK_SIZE
+from .ipfs import IPFSStorage
+
+class WriteBehindUploader:
+    """
+    Write-behind front end for IPFSStorage.
+    save_proof appends the proof to a local write-ahead log, fsyncs it and returns the
+    locally computed CID immediately; a background worker drains the log to IPFS in
+    batched multi-file `add` calls. The log is only advanced past records IPFS has
+    accepted, so an acknowledged proof survives a crash and is re-uploaded on restart.
+    """
+    def __init__(self, storage: IPFSStorage, wal_dir: Union[str, Path] = "sentinel_wal",
+                 batch_size: int = 64, flush_interval: float = 0.5, max_backoff: float = 30.0):
+        self.storage = storage
+        self.wal_dir = Path(wal_dir)
+        self.wal_dir.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.wal_dir / "proofs.wal"
+        self.offset_path = self.wal_dir / "proofs.offset"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_backoff = max_backoff
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._log = open(self.log_path, "ab")
+        self._offset = self._read_offset()
+        self._pending: List[float] = []  # Append times of records not yet uploaded, oldest first
+        self._recover()
+
+        self._stop = False
+        self._worker: Optional[threading.Thread] = None
+        self.uploaded = 0
+        self.retries = 0
+        self.cid_mismatches = 0
+        self.last_flush_latency_ms: Optional[float] = None
+
+    # --- Log bookkeeping ---
+
+    def _read_offset(self) -> int:
+        try:
+            offset = int(self.offset_path.read_text().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+        # An offset past the end can only be stale; replaying from the start is always safe
+        return offset if offset <= self.log_path.stat().st_size else 0
+
+    def _write_offset(self, offset: int):
+        tmp_path = self.offset_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            f.write(str(offset))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.offset_path)
+
+    def _recover(self):
+        # Records left over from a previous run are still owed to IPFS
+        now = time.time()
+        self._pending = [now for _ in self._read_records(self._offset, limit=None)[0]]
+
+    def _read_records(self, offset: int, limit: Optional[int]) -> Tuple[List[Tuple[str, bytes]], int]:
+        records = []
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            while limit is None or len(records) < limit:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break  # End of log, or a torn write that was never acknowledged
+                cid, _, content = line[:-1].partition(b"\t")
+                records.append((cid.decode("ascii"), content))
+                offset += len(line)
+        return records, offset
+
+    # --- Public API ---
+
+    def save_proof(self, proof: Dict[str, Any]) -> str:
+        """
+        Durably logs the proof and returns its CID without waiting for IPFS.
+        """
+        content = canonical_bytes(proof)
+        if len(content) > DEFAULT_CHUNK_SIZE:
+            # Multi-block files need the node to compute their CID
+            return self.storage.save_proof(proof)
+
+        cid = compute_cid_v0(content)
+        # Readable locally right away, before the upload lands
+        self.storage.local_store.put(cid, content, proof)
+
+        with self._lock:
+            self._log.write(cid.encode("ascii") + b"\t" + content + b"\n")
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._pending.append(time.time())
+            self._wakeup.notify_all()
+        return cid
+
+    def start(self) -> "WriteBehindUploader":
+        if self._worker is None:
+            self._stop = False
+            self._worker = threading.Thread(target=self._run, name="argus-ipfs-uploader", daemon=True)
+            self._worker.start()
+        return self
+
+    def stop(self, flush_timeout: float = 10.0):
+        """
+        Tries to drain the backlog, then stops the worker. Anything left stays in the log for the next run.
+        """
+        self.flush(flush_timeout)
+        with self._lock:
+            self._stop = True
+            self._wakeup.notify_all()
+        if self._worker:
+            self._worker.join(timeout=flush_timeout)
+            self._worker = None
+        self._log.close()
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Waits until every acknowledged proof has been uploaded. Returns False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            self._wakeup.notify_all()
+            while self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._wakeup.wait(min(remaining, 0.05))
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backlog": len(self._pending),
+                "oldest_pending_s": round(time.time() - self._pending[0], 3) if self._pending else 0.0,
+                "uploaded": self.uploaded,
+                "retries": self.retries,
+                "cid_mismatches": self.cid_mismatches,
+                "last_flush_latency_ms": self.last_flush_latency_ms,
+            }
+
+    # --- Worker ---
+
+    def _run(self):
+        backoff = self.flush_interval
+        while True:
+            with self._lock:
+                if not self._pending and not self._stop:
+                    self._wakeup.wait(self.flush_interval)
+                if self._stop:
+                    return
+                if not self._pending:
+                    continue
+
+            try:
+                uploaded_any = self._drain_batch()
+                backoff = self.flush_interval
+            except Exception as e:
+                uploaded_any = False
+                self.retries += 1
+                print(f"Write-behind upload failed, will retry: {e}")
+                # Full jitter, capped, so a dead node is not hammered
+                time.sleep(random.uniform(0, backoff))
+                backoff = min(backoff * 2, self.max_backoff)
+
+            if not uploaded_any:
+                with self._lock:
+                    if self._stop:
+                        return
+                    self._wakeup.wait(self.flush_interval)
+
+    def _drain_batch(self) -> bool:
+        records, next_offset = self._read_records(self._offset, self.batch_size)
+        if not records:
+            return False
+        if not self.storage.available:
+            raise ConnectionError("IPFS node unavailable")
+
+        start = time.perf_counter()
+        files = [("file", (f"{cid}.json", content)) for cid, content in records]
+        res = self.storage._post("/api/v0/add", files=files)
+        # Multi-file add answers with one JSON object per line
+        added = [json.loads(line) for line in res.text.splitlines() if line.strip()]
+        for (cid, _), entry in zip(records, added):
+            if entry.get("Hash") != cid:
+                self.cid_mismatches += 1
+                print(f"IPFS assigned {entry.get('Hash')} to proof logged as {cid}")
+
+        with self._lock:
+            self._offset = next_offset
+            del self._pending[:len(records)]
+            self.uploaded += len(records)
+            self.last_flush_latency_ms = round((time.perf_counter() - start) * 1000, 1)
+
+            if not self._pending:
+                # Fully drained: compact the log back to empty. The offset is reset first so a
+                # crash in between can only cause a harmless re-upload, never a skipped record.
+                self._offset = 0
+                self._write_offset(0)
+                self._log.truncate(0)
+            else:
+                self._write_offset(self._offset)
+            self._wakeup.notify_all()
+        return True
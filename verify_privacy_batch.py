@@ -0,0 +1,47 @@
+from sentinel.core.constraints import PRIVACY_OPERATORS, PrivacyEngine
+import json
+import sys
+
+print("--- STARTING PRIVACY BATCH PARITY TEST ---")
+
+# Columns where a float64 comparison would round: ints above 2**53, mixed ints/floats, ints beyond int64
+BIG = 2 ** 53
+columns = {
+    "small ints": [650, 700, 701, -3, 0],
+    "floats": [699.5, 700.0, 700.25, float("inf")],
+    "ints above 2**53": [BIG, BIG + 1, BIG - 1, 2 ** 62 + 1],
+    "mixed ints and floats": [BIG + 1, float(BIG), 700, 700.5],
+    "ints beyond int64": [2 ** 63, -(2 ** 63) - 1, 2 ** 70],
+    "bools and strings": [True, "750", None, 700],
+}
+thresholds = [700, 700.0, BIG, float(BIG), BIG + 1, 2 ** 63]
+
+failures = 0
+checks = 0
+for name, values in columns.items():
+    records = [json.dumps({"score": value, "name": "Jane Doe"}) for value in values]
+    for op in PRIVACY_OPERATORS:
+        for threshold in thresholds:
+            rules = PrivacyEngine.compile_rules({"rules": [{"field": "score", "op": op, "value": threshold}]})
+            expected = []
+            for record in records:
+                try:
+                    expected.append(rules.apply(record))
+                except Exception as e:
+                    expected.append(type(e))
+            batch = [r if isinstance(r, tuple) else type(r) for r in rules.apply_batch(records, return_exceptions=True)]
+            checks += 1
+            if batch != expected:
+                failures += 1
+                print(f"   [FAIL] {name}: score {op} {threshold!r}")
+                for record, want, got in zip(records, expected, batch):
+                    if want != got:
+                        print(f"          {record}: apply={want} apply_batch={got}")
+
+if failures:
+    print(f"   [FAIL] {failures} of {checks} rule/column combinations differ between apply() and apply_batch()")
+else:
+    print(f"   [PASS] apply_batch() matches apply() for all {checks} rule/column combinations")
+
+print("--- END TEST ---")
+sys.exit(1 if failures else 0)
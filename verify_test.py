@@ -33,6 +33,7 @@ else:
 
 # 4. Tamper
 print("4. Testing Tamper Detection...")
+proof = proof.to_dict() # Tamper with a plain copy of the issued credential
 proof['credentialSubject']['executionTrace']['output'] = "HACKED output that doesn't match hash"
 # We save this tampered proof. The 'trace_hash' in the proof object 
 # still matches the OLD trace, but the 'trace' content is new.